@@ -1,9 +1,9 @@
-import requests
+from http_session import SESSION
 import json
 
 print("Checking API response for Interceptions and Sacks...\n")
 
-r = requests.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2024&limit=100')
+r = SESSION.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2024&limit=100')
 data = r.json()
 qbs = [p for p in data['data'] if p.get('position') == 'QB'][:5]
 
@@ -22,7 +22,7 @@ try:
         
         f.write("\n\nSAMPLE DATA (First 3 rows):\n")
         f.write("-" * 80 + "\n")
-        f.write(df.head(3).to_string())
+        f.write(df.head(3).to_csv(index=False))
         
         f.write("\n\nDATA TYPES:\n")
         f.write("-" * 80 + "\n")
@@ -30,16 +30,15 @@ try:
         
         f.write("\n\nCOLUMN INFO:\n")
         f.write("-" * 80 + "\n")
+        # Min/max for every numeric column (any width) in one aggregation
+        ranges = df.select_dtypes(include="number").agg(["min", "max"])
         for col in df.columns:
             dtype = df[col].dtype
             non_null = df[col].notna().sum()
             pct = (non_null / len(df)) * 100
             f.write(f"{col}: {dtype}, {non_null:,} non-null ({pct:.1f}%)\n")
-            if dtype in ['float64', 'int64']:
-                try:
-                    f.write(f"  Range: {df[col].min()} - {df[col].max()}\n")
-                except:
-                    pass
+            if col in ranges.columns:
+                f.write(f"  Range: {ranges.at['min', col]} - {ranges.at['max', col]}\n")
     
     print(f"✅ Results written to nextgen_exploration.txt")
     print(f"   Shape: {df.shape}")
@@ -1,11 +1,4 @@
-import nflreadpy
-import pandas as pd
+"""Equivalent to `python checks.py snaps`; see checks.py."""
+from checks import main
 
-print("Checking Snap Counts 2024...")
-try:
-    df = nflreadpy.load_snap_counts(seasons=[2024])
-    print(f"Loaded {len(df)} rows")
-    print("Columns:", list(df.columns))
-    print("Sample:", df.iloc[0].to_dict())
-except Exception as e:
-    print(f"Error: {e}")
+main(["snaps"])
@@ -0,0 +1,363 @@
+"""
+Consolidated nflreadpy data checks.
+
+Each of the old check_*.py scripts is a subcommand here, so several checks
+can run in one process and share the interpreter start-up, imports and any
+dataset that has already been downloaded.
+
+Usage:
+    python checks.py granularity routes snaps
+    python checks.py columns --season 2023
+    python checks.py all
+"""
+
+import argparse
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import nflreadpy
+import pandas as pd
+import polars as pl
+
+# Datasets already loaded in this process, keyed by (dataset, season, kwargs)
+_RAW: Dict[Tuple[Any, ...], Any] = {}
+_PANDAS: Dict[Tuple[Any, ...], pd.DataFrame] = {}
+
+
+def _key(dataset: str, season: Optional[int], kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (dataset, season, tuple(sorted(kwargs.items())))
+
+
+def load_raw(dataset: str, season: Optional[int], **kwargs: Any) -> Any:
+    """Load a dataset via nflreadpy once per process and return the native frame."""
+    key = _key(dataset, season, kwargs)
+    if key not in _RAW:
+        loader = getattr(nflreadpy, f"load_{dataset}")
+        if season is None:
+            _RAW[key] = loader(**kwargs)
+        else:
+            _RAW[key] = loader(seasons=[season], **kwargs)
+    return _RAW[key]
+
+
+def load(dataset: str, season: Optional[int], **kwargs: Any) -> pd.DataFrame:
+    """Load a dataset as pandas, converting at most once per process."""
+    key = _key(dataset, season, kwargs)
+    if key not in _PANDAS:
+        df = load_raw(dataset, season, **kwargs)
+        _PANDAS[key] = df.to_pandas() if hasattr(df, "to_pandas") else df
+    return _PANDAS[key]
+
+
+def check_alternative_routes(season: Optional[int]) -> None:
+    season = season or 2025
+    print(f"Checking for alternative route data sources for {season}...\n")
+
+    # Check Next Gen Stats
+    print("1. Checking Next Gen Stats...")
+    try:
+        ngs_df = load("nextgen_stats", season, stat_type="receiving")
+        print(f"   Loaded {len(ngs_df)} rows")
+        print(f"   Columns: {[c for c in ngs_df.columns if 'route' in c.lower() or 'cushion' in c.lower() or 'separation' in c.lower()]}")
+    except Exception as e:
+        print(f"   Error: {e}")
+
+    # Check Snap Counts
+    print("\n2. Checking Snap Counts...")
+    try:
+        snaps_df = load("snap_counts", season)
+        print(f"   Loaded {len(snaps_df)} rows")
+        print(f"   Columns: {snaps_df.columns.tolist()}")
+
+        # Check if we can use offense_pct to estimate routes
+        if 'offense_pct' in snaps_df.columns:
+            print("\n   Found offense_pct!")
+            print(f"   Sample data:")
+            sample = snaps_df[snaps_df['position'].isin(['WR', 'TE'])].head(3)
+            print(sample[['player', 'position', 'week', 'offense_snaps', 'offense_pct']].to_string(index=False))
+    except Exception as e:
+        print(f"   Error: {e}")
+
+    # Check FTN Charting (sometimes has route data)
+    print("\n3. Checking FTN Charting...")
+    try:
+        ftn_df = load("ftn_charting", season)
+        print(f"   Loaded {len(ftn_df)} rows")
+        route_cols = [c for c in ftn_df.columns if 'route' in c.lower()]
+        print(f"   Route columns: {route_cols}")
+    except Exception as e:
+        print(f"   Error: {e}")
+
+    print("\n=== Conclusion ===")
+    print(f"Best available option for {season} routes:")
+    print("  - Snap counts data (if available) + pass play %")
+    print("  - OR Targeted receiver counts (underestimates but better than 0)")
+
+
+def check_columns(season: Optional[int]) -> None:
+    season = season or 2024
+    print("Checking column names and data for Interceptions and Sacks...\n")
+
+    df = load("player_stats", season)
+
+    print(f"Columns: {sorted(df.columns.tolist())}")
+
+    # Check for interception/sack related columns
+    int_cols = [c for c in df.columns if 'int' in c.lower() or 'intercept' in c.lower()]
+    sack_cols = [c for c in df.columns if 'sack' in c.lower()]
+
+    print(f"\nInterception columns: {int_cols}")
+    print(f"Sack columns: {sack_cols}")
+
+    # Check values for top QBs
+    print("\nTop 5 QBs by attempts:")
+    qbs = df[df['position'] == 'QB'].sort_values('attempts', ascending=False).head(5)
+    cols_to_show = ['player_name', 'attempts', 'completions'] + int_cols + sack_cols
+    print(qbs[cols_to_show].to_string())
+
+    # Check CPOE column
+    cpoe_cols = [c for c in df.columns if 'cpoe' in c.lower()]
+    print(f"\nCPOE columns: {cpoe_cols}")
+
+
+def check_advanced(season: Optional[int]) -> None:
+    season = season or 2024
+    try:
+        df = load("player_stats", season)
+        advanced = ['target_share', 'wopr', 'racr', 'air_yards_share', 'cpoe', 'dakota', 'pacr']
+        found = [col for col in advanced if col in df.columns]
+        missing = [col for col in advanced if col not in df.columns]
+        print(f"FOUND: {found}")
+        print(f"MISSING: {missing}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def check_structure(season: Optional[int]) -> None:
+    season = season or 2025
+    df = load("player_stats", season)
+
+    print(f"Total records: {len(df)}")
+    print(f"\nFirst few column names: {list(df.columns[:20])}")
+    print(f"\nChecking if 'week' column exists: {'week' in df.columns}")
+
+    if 'week' in df.columns:
+        print(f"Unique weeks: {sorted(df['week'].unique())}")
+        print("\nThis appears to be WEEKLY data!")
+
+        # Find Rodgers
+        rodgers = df[df['player_display_name'] == 'Aaron Rodgers']
+        if len(rodgers) > 0:
+            print(f"\nAaron Rodgers has {len(rodgers)} weekly records")
+            print("\nFirst 5 weeks:")
+            print(rodgers[['week', 'fantasy_points_ppr', 'passing_yards', 'passing_tds']].head())
+
+            print(f"\nSeason total fantasy points: {rodgers['fantasy_points_ppr'].sum():.1f}")
+    else:
+        print("\nNo 'week' column - this might be season totals already")
+
+
+def check_df_type(season: Optional[int]) -> None:
+    season = season or 2024
+    df = load_raw("player_stats", season)
+    print(f"Type: {type(df)}")
+    print(f"Has to_dict: {hasattr(df, 'to_dict')}")
+    print(f"Dir: {[m for m in dir(df) if 'dict' in m.lower()]}")
+
+    # Try to convert to pandas if it's Polars
+    if hasattr(df, 'to_pandas'):
+        print("\nConverting from Polars to Pandas...")
+        df_pd = load("player_stats", season)
+        print(f"Pandas type: {type(df_pd)}")
+        print(f"Columns: {list(df_pd.columns[:10])}")
+
+        # Test dict conversion
+        import json
+        records = df_pd.head(2).to_dict(orient='records')
+        print(f"\nFirst record keys: {list(records[0].keys())[:10]}")
+        print(f"Sample: {json.dumps(records[0], default=str)[:300]}")
+
+
+def check_extra_datasets(season: Optional[int]) -> None:
+    season = season or 2024
+    print(f"Checking FTN Charting {season}...")
+    try:
+        df_ftn = load("ftn_charting", season)
+        print(f"FTN Loaded: {len(df_ftn)} rows")
+        print("Columns:", df_ftn.columns.tolist())
+    except Exception as e:
+        print(f"FTN Error: {e}")
+
+    print(f"\nChecking Participation {season}...")
+    try:
+        df_part = load("participation", season)
+        print(f"Participation Loaded: {len(df_part)} rows")
+        print("Columns:", df_part.columns.tolist())
+    except Exception as e:
+        print(f"Participation Error: {e}")
+
+
+def check_ftn_columns(season: Optional[int]) -> None:
+    season = season or 2024
+    print(f"Checking FTN Charting {season}...")
+    try:
+        df_ftn = load("ftn_charting", season)
+        print(f"FTN Loaded: {len(df_ftn)} rows")
+        print("Columns:", list(df_ftn.columns))
+        print("Sample row:", df_ftn.iloc[0].to_dict())
+    except Exception as e:
+        print(f"FTN Error: {e}")
+
+
+def check_granularity(season: Optional[int]) -> None:
+    season = season or 2024
+    print("Checking Player Stats Granularity...")
+    try:
+        df = load("player_stats", season)
+        print(f"Loaded {len(df)} rows")
+        print("Columns:", list(df.columns))
+        if 'week' in df.columns:
+            print("Has 'week' column - likely weekly")
+        else:
+            print("No 'week' column - likely season")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def check_ngs(season: Optional[int]) -> None:
+    season = season or 2024
+    print("\nChecking NGS Receiving...")
+    try:
+        df = load("nextgen_stats", season, stat_type="receiving")  # NGS needs stat_type
+        print(f"Loaded {len(df)} rows")
+        cols = df.columns.tolist()
+
+        route_cols = [c for c in cols if 'route' in c.lower()]
+        print(f"Route columns: {route_cols}")
+        print("Columns:", cols)
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def check_part_format(season: Optional[int]) -> None:
+    season = season or 2024
+    print("Checking Participation Format...")
+    try:
+        df = load_raw("participation", season)
+        print(f"Loaded {len(df)} rows")
+        offense = df.filter(pl.col('offense_players').is_not_null()).select('offense_players')
+        sample = offense.get_column('offense_players').head(1).item()
+        print(f"Sample offense_players ({type(sample)}): {sample}")
+
+        # Split the semicolon-separated gsis ids with a Polars string kernel
+        counts = offense.select(pl.col('offense_players').str.split(';').list.len())
+        print(f"Players per play: min={counts.min().item()}, max={counts.max().item()}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def check_routes(season: Optional[int]) -> None:
+    season = season or 2024
+    try:
+        print(f"Loading {season} player stats...")
+        df = load("player_stats", season)
+
+        route_cols = [c for c in df.columns if 'route' in c.lower()]
+        print(f"Route columns found: {route_cols}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def check_routes_detailed(season: Optional[int]) -> None:
+    season = season or 2024
+    for name, dataset in [("FTN", "ftn_charting"), ("Participation", "participation")]:
+        print(f"\nChecking {name}...")
+        try:
+            df = load(dataset, season)
+            print(f"Loaded {len(df)} rows")
+            cols = df.columns.tolist()
+
+            route_cols = [c for c in cols if 'route' in c.lower()]
+            print(f"Route columns: {route_cols}")
+
+            # Check for player identifiers
+            id_cols = [c for c in cols if 'id' in c.lower() or 'player' in c.lower()]
+            print(f"ID columns (first 5): {id_cols[:5]}")
+        except Exception as e:
+            print(f"Error: {e}")
+
+
+def check_snaps(season: Optional[int]) -> None:
+    season = season or 2024
+    print(f"Checking Snap Counts {season}...")
+    try:
+        df = load("snap_counts", season)
+        print(f"Loaded {len(df)} rows")
+        print("Columns:", list(df.columns))
+        print("Sample:", df.iloc[0].to_dict())
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def check_type(season: Optional[int]) -> None:
+    season = season or 2024
+    print("Checking DF Type...")
+    try:
+        df = load_raw("participation", season)
+        print(f"Type: {type(df)}")
+
+        if hasattr(df, 'to_pandas'):
+            print("Has to_pandas()")
+            df_pd = load("participation", season)
+            print(f"Converted Type: {type(df_pd)}")
+            sample = df.filter(pl.col('offense_players').is_not_null()).get_column('offense_players').head(1).item()
+            print(f"Sample: {sample}")
+        else:
+            print("No to_pandas()")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+CHECKS: Dict[str, Callable[[Optional[int]], None]] = {
+    "alternative_routes": check_alternative_routes,
+    "columns": check_columns,
+    "advanced": check_advanced,
+    "structure": check_structure,
+    "df_type": check_df_type,
+    "extra_datasets": check_extra_datasets,
+    "ftn_columns": check_ftn_columns,
+    "granularity": check_granularity,
+    "ngs": check_ngs,
+    "part_format": check_part_format,
+    "routes": check_routes,
+    "routes_detailed": check_routes_detailed,
+    "snaps": check_snaps,
+    "type": check_type,
+}
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run nflreadpy data checks in a single process.")
+    parser.add_argument(
+        "modes",
+        nargs="+",
+        choices=sorted(CHECKS) + ["all"],
+        help="Checks to run, in order ('all' runs every check)",
+    )
+    parser.add_argument(
+        "--season",
+        type=int,
+        default=None,
+        help="Season to check (defaults to each check's usual season)",
+    )
+    args = parser.parse_args(argv)
+
+    modes = list(CHECKS) if "all" in args.modes else args.modes
+    for i, mode in enumerate(modes):
+        if i:
+            print("\n" + "=" * 80 + "\n")
+        CHECKS[mode](args.season)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
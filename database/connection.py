@@ -27,12 +27,17 @@ engine = create_engine(
     poolclass=QueuePool,
     pool_size=10,              # Number of connections to maintain
     max_overflow=20,           # Additional connections if pool is exhausted
-    pool_pre_ping=True,        # Verify connections before using
-    pool_recycle=3600,         # Recycle connections after 1 hour
+    pool_pre_ping=False,       # Skip per-checkout SELECT 1; keepalives detect dead peers
+    pool_recycle=300,          # Recycle connections after 5 minutes
     echo=False,                # Set to True for SQL logging (dev only)
+    executemany_mode="values_plus_batch",  # Batch bulk inserts/updates
     connect_args={
         "connect_timeout": 10,
         "application_name": "nfl_datamans_api",
+        "options": "-c statement_timeout=30000",
+        # TCP keepalives replace pool_pre_ping for stale connection detection
+        "keepalives": 1,
+        "keepalives_idle": 30,
     }
 )
 
@@ -9,6 +9,7 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 import pandas as pd
+import pyarrow as pa
 import logging
 
 from .connection import SessionLocal
@@ -36,6 +37,38 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per server-side cursor round trip when streaming results
+STREAM_YIELD_PER = 10_000
+
+
+def _fetch_dataframe(db: Session, query, params: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Execute a query and stream the rows into a DataFrame.
+    
+    Uses a server-side cursor so only ``STREAM_YIELD_PER`` rows are held as
+    Python objects at a time; each chunk is converted to an Arrow table and
+    the tables are concatenated once at the end.
+    
+    Returns:
+        DataFrame with query results (empty DataFrame if no rows)
+    """
+    result = db.execute(
+        query.execution_options(stream_results=True, yield_per=STREAM_YIELD_PER),
+        params,
+    )
+    cols = tuple(result.keys())
+    
+    tables = []
+    for chunk in result.partitions():
+        tables.append(pa.Table.from_pydict(dict(zip(cols, zip(*chunk)))))
+    
+    if not tables:
+        return pd.DataFrame()
+    
+    # Types are inferred per chunk: unify them (null -> concrete type, and
+    # NUMERIC decimals of differing precision/scale -> one wider decimal)
+    return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
 
 class PlayerStatsQuery:
     """Query layer for player stats from PostgreSQL."""
@@ -88,14 +121,7 @@ class PlayerStatsQuery:
             
             query = text(" ".join(query_parts))
             
-            result = db.execute(query, params)
-            rows = result.fetchall()
-            columns = result.keys()
-            
-            if not rows:
-                return pd.DataFrame()
-            
-            return pd.DataFrame(rows, columns=columns)
+            return _fetch_dataframe(db, query, params)
             
         except Exception as e:
             logger.error(f"Error querying player stats: {e}")
@@ -153,14 +179,11 @@ class PlayerStatsQuery:
             query_parts.append("ORDER BY season DESC")
             
             query = text(" ".join(query_parts))
-            result = db.execute(query, params)
-            rows = result.fetchall()
-            columns = result.keys()
+            df = _fetch_dataframe(db, query, params)
             
-            if not rows:
+            if df.empty:
                 return {}
             
-            df = pd.DataFrame(rows, columns=columns)
             return df.to_dict(orient='records')
             
         except Exception as e:
@@ -195,10 +218,11 @@ class PlayerStatsQuery:
             """)
             
             result = db.execute(query, {'season': season})
+            cols = tuple(result.keys())
             row = result.fetchone()
             
             if row:
-                return dict(zip(result.keys(), row))
+                return dict(zip(cols, row))
             return {}
             
         except Exception as e:
@@ -239,14 +263,7 @@ class ScheduleQuery:
             query_parts.append("ORDER BY week, game_id")
             
             query = text(" ".join(query_parts))
-            result = db.execute(query, params)
-            rows = result.fetchall()
-            columns = result.keys()
-            
-            if not rows:
-                return pd.DataFrame()
-            
-            return pd.DataFrame(rows, columns=columns)
+            return _fetch_dataframe(db, query, params)
             
         except Exception as e:
             logger.error(f"Error querying schedule: {e}")
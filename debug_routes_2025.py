@@ -1,5 +1,8 @@
 import nflreadpy
 import pandas as pd
+import polars as pl
+
+from nflread_adapter import nflverse_parquet_url
 
 print("Checking 2025 routes calculation...")
 
@@ -22,18 +25,20 @@ except Exception as e:
 # Load PBP data
 print("\n2. Loading PBP for 2025...")
 try:
-    pbp_df = nflreadpy.load_pbp(seasons=[2025])
-    print(f"   Loaded {len(pbp_df)} rows")
-    print(f"   Columns with 'play': {[c for c in pbp_df.columns if 'play' in c.lower()]}")
+    pbp_lf = pl.scan_parquet(nflverse_parquet_url("pbp", 2025))
+    pbp_columns = pbp_lf.collect_schema().names()
+    print(f"   Columns with 'play': {[c for c in pbp_columns if 'play' in c.lower()]}")
     
-    # Check play_type values
-    if 'play_type' in pbp_df.columns:
-        print(f"   play_type values: {pbp_df['play_type'].value_counts().head()}")
-        pass_plays = pbp_df[pbp_df['play_type'] == 'pass']
-        print(f"   Pass plays: {len(pass_plays)}")
+    # Check play_type values (only this column is read from the parquet file)
+    if 'play_type' in pbp_columns:
+        play_type = pbp_lf.select('play_type').collect().get_column('play_type')
+        print(f"   Loaded {len(play_type)} rows")
+        print(f"   play_type values: {play_type.value_counts(sort=True).head()}")
+        pass_plays = (play_type == 'pass').sum()
+        print(f"   Pass plays: {pass_plays}")
     else:
         print("   'play_type' column not found")
-        print(f"   Available columns: {pbp_df.columns.tolist()[:20]}")
+        print(f"   Available columns: {pbp_columns[:20]}")
 except Exception as e:
     print(f"   Error: {e}")
 
@@ -42,11 +47,15 @@ print("\n3. Loading Participation for 2025...")
 try:
     part_df = nflreadpy.load_participation(seasons=[2025])
     print(f"   Loaded {len(part_df)} rows")
-    print(f"   Columns: {part_df.columns.tolist()}")
+    print(f"   Columns: {part_df.columns}")
     
     if 'offense_players' in part_df.columns:
-        sample = part_df['offense_players'].head(3)
-        print(f"   Sample offense_players: {sample.tolist()}")
+        sample = (
+            part_df.filter(pl.col('offense_players').is_not_null())
+            .get_column('offense_players')
+            .head(3)
+        )
+        print(f"   Sample offense_players: {sample.to_list()}")
     else:
         print("   'offense_players' column not found")
 except Exception as e:
@@ -2,14 +2,70 @@
 Explore NextGen Stats data structure from nflreadpy
 """
 
+import re
+
+import numpy as np
 import pandas as pd
+import polars as pl
 from nflread_adapter import import_library, call_dataset
 
+BANNER = "=" * 80
+MEMORY_SAMPLE_ROWS = 1000
+NUMERIC_DTYPES = ('float64', 'int64', 'float32', 'int32')
+
+IDENTIFIER_CANDIDATES = ['player_id', 'gsis_id', 'player_name', 'player', 'name',
+                         'season', 'week', 'team', 'position', 'pos']
+TEMPORAL_KEYWORDS = ['season', 'week', 'year', 'date', 'game']
+POS_TEAM_KEYWORDS = ['position', 'pos', 'team', 'club']
+NGS_KEYWORDS = ['speed', 'acceleration', 'distance', 'time', 'separation',
+                'cushion', 'target', 'catch', 'epa', 'expected', 'actual',
+                'air_yards', 'yac', 'completion', 'interception']
+
+
+def _keyword_pattern(keywords):
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+TEMPORAL_PATTERN = _keyword_pattern(TEMPORAL_KEYWORDS)
+POS_TEAM_PATTERN = _keyword_pattern(POS_TEAM_KEYWORDS)
+NGS_PATTERN = _keyword_pattern(NGS_KEYWORDS)
+
+
+def classify_columns(columns: pd.Index) -> dict:
+    """Bucket column names into identifier/temporal/pos_team/ngs lists."""
+    lowered = pd.Index(columns.astype(str)).str.lower()
+    candidates = np.array(IDENTIFIER_CANDIDATES)
+    return {
+        'identifier': candidates[np.isin(candidates, columns)].tolist(),
+        'temporal': columns[lowered.str.contains(TEMPORAL_PATTERN)].tolist(),
+        'pos_team': columns[lowered.str.contains(POS_TEAM_PATTERN)].tolist(),
+        'ngs': columns[lowered.str.contains(NGS_PATTERN)].tolist(),
+    }
+
+
+def approx_memory_mb(df: pd.DataFrame) -> float:
+    """Estimate frame size without walking every object cell.
+
+    Fixed-width columns are itemsize * rows; object/extension columns are
+    measured on a head() sample and scaled up to the full length.
+    """
+    if len(df) == 0:
+        return 0.0
+    fixed = [c for c, dt in df.dtypes.items() if isinstance(dt, np.dtype) and dt.kind != 'O']
+    fixed_bytes = sum(df.dtypes[c].itemsize for c in fixed) * len(df)
+    other = df.columns.difference(fixed, sort=False)
+    other_bytes = 0.0
+    if len(other) > 0:
+        sample = df[other].head(MEMORY_SAMPLE_ROWS)
+        other_bytes = sample.memory_usage(index=False, deep=True).sum() / len(sample) * len(df)
+    return (fixed_bytes + other_bytes) / 1024**2
+
+
 def explore_nextgen_stats():
     """Load and explore nextgen stats data."""
-    print("=" * 80)
+    print(BANNER)
     print("Exploring NextGen Stats Data")
-    print("=" * 80)
+    print(BANNER)
     
     # Import library
     try:
@@ -35,154 +91,184 @@ def explore_nextgen_stats():
             return
     
     # Basic info
-    print("=" * 80)
+    print(BANNER)
     print("DATASET OVERVIEW")
-    print("=" * 80)
+    print(BANNER)
     print(f"Shape: {df.shape[0]:,} rows × {df.shape[1]} columns")
-    print(f"Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    print(f"Memory usage (approx.): {approx_memory_mb(df):.2f} MB")
     
     # Column information
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("COLUMNS")
-    print("=" * 80)
+    print(BANNER)
     print(f"\nTotal columns: {len(df.columns)}")
     print("\nColumn names:")
-    for i, col in enumerate(df.columns, 1):
-        print(f"  {i:3d}. {col}")
+    print("\n".join(f"  {i:3d}. {col}" for i, col in enumerate(df.columns, 1)))
     
     # Data types
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("DATA TYPES")
-    print("=" * 80)
+    print(BANNER)
     dtype_counts = df.dtypes.value_counts()
     for dtype, count in dtype_counts.items():
         print(f"  {dtype}: {count} columns")
     
+    # One pass over the dtypes; later sections look columns up in these
+    dtype_of = {}
+    numeric_cols = []
+    for col, dtype in df.dtypes.items():
+        dtype_of[col] = dtype.name
+        if dtype.name in NUMERIC_DTYPES:
+            numeric_cols.append(col)
+    
     # Sample data
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("SAMPLE DATA (First 5 rows)")
-    print("=" * 80)
+    print(BANNER)
     pd.set_option('display.max_columns', None)
     pd.set_option('display.width', None)
     pd.set_option('display.max_colwidth', 30)
     print(df.head())
     
+    column_groups = classify_columns(df.columns)
+    
+    # Profile once in Polars: one parallel hash aggregation per column
+    pl_df = pl.from_pandas(df)
+    count_cols = list(dict.fromkeys(
+        column_groups['identifier'] + column_groups['temporal']
+        + [c for c in ('player_name', 'player') if c in df.columns]
+    ))
+    unique_counts = pl_df.select(
+        [pl.col(c).drop_nulls().n_unique() for c in count_cols]
+    ).row(0, named=True) if count_cols else {}
+    
     # Check for key identifier columns
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("KEY IDENTIFIER COLUMNS")
-    print("=" * 80)
-    identifier_candidates = ['player_id', 'gsis_id', 'player_name', 'player', 'name', 
-                            'season', 'week', 'team', 'position', 'pos']
-    found_identifiers = [col for col in identifier_candidates if col in df.columns]
+    print(BANNER)
+    found_identifiers = column_groups['identifier']
     if found_identifiers:
         print("Found identifier columns:")
         for col in found_identifiers:
             print(f"  - {col}")
             if col in ['player_id', 'gsis_id']:
-                print(f"    Unique values: {df[col].nunique():,}")
+                print(f"    Unique values: {unique_counts[col]:,}")
     else:
         print("⚠️  No standard identifier columns found. Available columns:")
         print(f"  {list(df.columns[:10])}")
     
     # Check for season/week columns
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("TEMPORAL COLUMNS")
-    print("=" * 80)
-    temporal_cols = [col for col in df.columns if any(x in col.lower() for x in ['season', 'week', 'year', 'date', 'game'])]
+    print(BANNER)
+    temporal_cols = column_groups['temporal']
     if temporal_cols:
         for col in temporal_cols:
             print(f"  - {col}: {df[col].dtype}")
-            if df[col].dtype in ['int64', 'int32']:
+            if dtype_of[col] in ('int64', 'int32'):
                 print(f"    Range: {df[col].min()} - {df[col].max()}")
-                print(f"    Unique values: {df[col].nunique()}")
+                print(f"    Unique values: {unique_counts[col]}")
     else:
         print("⚠️  No temporal columns found")
     
     # Check for position/team columns
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("POSITION/TEAM COLUMNS")
-    print("=" * 80)
-    pos_team_cols = [col for col in df.columns if any(x in col.lower() for x in ['position', 'pos', 'team', 'club'])]
+    print(BANNER)
+    pos_team_cols = column_groups['pos_team']
     if pos_team_cols:
+        object_cols = [col for col in pos_team_cols if dtype_of[col] == 'object']
+        value_stats = pl_df.select(
+            [pl.col(c).drop_nulls().n_unique().alias(f"{c}__n") for c in object_cols]
+            + [pl.col(c).drop_nulls().unique().sort().head(10).implode() for c in object_cols]
+        ).row(0, named=True) if object_cols else {}
         for col in pos_team_cols:
             print(f"  - {col}:")
-            if df[col].dtype == 'object':
-                unique_vals = df[col].dropna().unique()
-                print(f"    Unique values ({len(unique_vals)}): {sorted(unique_vals)[:10]}")
+            if col in object_cols:
+                print(f"    Unique values ({value_stats[f'{col}__n']}): {value_stats[col]}")
             else:
                 print(f"    Type: {df[col].dtype}")
     else:
         print("⚠️  No position/team columns found")
     
     # Look for NextGen-specific metrics
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("NEXTGEN-SPECIFIC METRICS")
-    print("=" * 80)
-    ngs_keywords = ['speed', 'acceleration', 'distance', 'time', 'separation', 
-                    'cushion', 'target', 'catch', 'epa', 'expected', 'actual',
-                    'air_yards', 'yac', 'completion', 'interception']
-    ngs_cols = []
-    for col in df.columns:
-        col_lower = col.lower()
-        if any(keyword in col_lower for keyword in ngs_keywords):
-            ngs_cols.append(col)
+    print(BANNER)
+    ngs_cols = column_groups['ngs']
     
     if ngs_cols:
         print(f"Found {len(ngs_cols)} potential NextGen metric columns:")
+        numeric_ngs = [c for c in ngs_cols if dtype_of[c] in NUMERIC_DTYPES]
+        # Ranges for every metric in one parallel select; null counts are column metadata
+        ngs_stats = pl_df.select(
+            [pl.col(c).min().alias(f"{c}__min") for c in numeric_ngs]
+            + [pl.col(c).max().alias(f"{c}__max") for c in numeric_ngs]
+        ).row(0, named=True)
+        null_counts = pl_df.null_count().row(0, named=True)
         for col in sorted(ngs_cols):
             dtype = df[col].dtype
-            non_null = df[col].notna().sum()
+            non_null = len(df) - null_counts[col]
             pct = (non_null / len(df)) * 100
             print(f"  - {col} ({dtype}): {non_null:,} non-null ({pct:.1f}%)")
-            if dtype in ['float64', 'float32', 'int64', 'int32']:
-                print(f"    Range: {df[col].min():.2f} - {df[col].max():.2f}")
+            if col in numeric_ngs:
+                print(f"    Range: {ngs_stats[f'{col}__min']:.2f} - {ngs_stats[f'{col}__max']:.2f}")
     else:
         print("⚠️  No obvious NextGen metric columns found")
     
     # Check data granularity
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("DATA GRANULARITY")
-    print("=" * 80)
+    print(BANNER)
     if 'season' in df.columns and 'week' in df.columns:
         print("Granularity: Weekly")
-        print(f"Seasons: {sorted(df['season'].unique())}")
+        print(f"Seasons: {pl_df.get_column('season').unique().sort().to_list()}")
         print(f"Weeks per season (sample):")
-        for season in sorted(df['season'].unique())[:3]:
-            weeks = df[df['season'] == season]['week'].unique()
-            print(f"  {season}: {len(weeks)} weeks ({min(weeks)}-{max(weeks)})")
+        weeks = (
+            pl_df.group_by('season')
+            .agg(
+                pl.col('week').n_unique().alias('n'),
+                pl.col('week').min().alias('first'),
+                pl.col('week').max().alias('last'),
+            )
+            .sort('season')
+            .head(3)
+        )
+        for season, n, first, last in weeks.iter_rows():
+            print(f"  {season}: {n} weeks ({first}-{last})")
     elif 'season' in df.columns:
         print("Granularity: Season-level")
-        print(f"Seasons: {sorted(df['season'].unique())}")
+        print(f"Seasons: {pl_df.get_column('season').unique().sort().to_list()}")
     else:
         print("⚠️  Could not determine granularity")
     
     # Sample statistics
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("SAMPLE STATISTICS")
-    print("=" * 80)
-    numeric_cols = df.select_dtypes(include=['float64', 'int64', 'float32', 'int32']).columns
-    if len(numeric_cols) > 0:
+    print(BANNER)
+    if numeric_cols:
         print(f"\nNumeric columns summary (showing first 10):")
-        print(df[numeric_cols[:10]].describe())
+        with pl.Config(tbl_cols=-1, tbl_width_chars=200):
+            print(pl_df.select(numeric_cols[:10]).describe())
     
     # Check for player matching
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("PLAYER MATCHING POTENTIAL")
-    print("=" * 80)
+    print(BANNER)
     if 'player_id' in df.columns or 'gsis_id' in df.columns:
         player_col = 'player_id' if 'player_id' in df.columns else 'gsis_id'
         print(f"✅ Can match on: {player_col}")
-        print(f"   Unique players: {df[player_col].nunique():,}")
+        print(f"   Unique players: {pl_df.get_column(player_col).drop_nulls().n_unique():,}")
     elif 'player_name' in df.columns or 'player' in df.columns:
         name_col = 'player_name' if 'player_name' in df.columns else 'player'
         print(f"⚠️  Can match on name: {name_col}")
-        print(f"   Unique players: {df[name_col].nunique():,}")
+        print(f"   Unique players: {unique_counts[name_col]:,}")
     else:
         print("❌ No clear player identifier found")
     
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("EXPLORATION COMPLETE")
-    print("=" * 80)
+    print(BANNER)
 
 if __name__ == "__main__":
     explore_nextgen_stats()
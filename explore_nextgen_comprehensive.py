@@ -2,67 +2,69 @@
 Comprehensive exploration of NextGen Stats
 NextGen Stats requires a stat_type parameter
 """
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pandas as pd
-from nflread_adapter import import_library, call_dataset
+import polars as pl
+import pyarrow as pa
+from nflread_adapter import import_library, resolve_dataset_callable
+
+BANNER = "=" * 80
+
+def load_stat_type(func, params, stat_type, season=2024):
+    """Call the NextGen loader for one stat_type and return a pyarrow Table"""
+    # Try calling with stat_type
+    if 'stat_type' in params:
+        result = func(seasons=[season], stat_type=stat_type)
+    elif 'statType' in params:
+        result = func(seasons=[season], statType=stat_type)
+    else:
+        # Try without stat_type first
+        result = func(seasons=[season])
+    
+    # Keep the result in Arrow; Polars hands its buffers over without a copy
+    if hasattr(result, 'to_arrow'):
+        return result.to_arrow()
+    if isinstance(result, pd.DataFrame):
+        return pa.Table.from_pandas(result, preserve_index=False)
+    return pa.Table.from_pandas(pd.DataFrame(result), preserve_index=False)
 
-def explore_stat_type(stat_type, season=2024):
-    """Explore a specific stat_type"""
-    print(f"\n{'='*80}")
+def explore_stat_type(stat_type, loaded: Future, func_name, params):
+    """Explore a specific stat_type once its (background) load has finished"""
+    print(f"\n{BANNER}")
     print(f"Exploring stat_type: {stat_type}")
-    print(f"{'='*80}")
+    print(BANNER)
     
     try:
-        mod = import_library()
-        
-        # Try calling with stat_type parameter
-        # First, get the function
-        from nflread_adapter import resolve_dataset_callable
-        func, func_name = resolve_dataset_callable(mod, "nextgen_stats")
-        
-        # Check function signature
-        import inspect
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
         print(f"Function: {func_name}")
         print(f"Parameters: {params}")
         
-        # Try calling with stat_type
-        if 'stat_type' in params:
-            result = func(seasons=[season], stat_type=stat_type)
-        elif 'statType' in params:
-            result = func(seasons=[season], statType=stat_type)
-        else:
-            # Try without stat_type first
-            result = func(seasons=[season])
+        tbl = loaded.result()
         
-        # Convert to DataFrame
-        if hasattr(result, 'to_pandas'):
-            df = result.to_pandas()
-        elif isinstance(result, pd.DataFrame):
-            df = result
-        else:
-            df = pd.DataFrame(result)
+        print(f"\n✅ Successfully loaded {tbl.num_rows} rows")
+        print(f"Shape: {tbl.num_rows:,} rows × {tbl.num_columns} columns")
         
-        print(f"\n✅ Successfully loaded {len(df)} rows")
-        print(f"Shape: {df.shape[0]:,} rows × {df.shape[1]} columns")
-        
-        print(f"\nColumns ({len(df.columns)}):")
-        for i, col in enumerate(df.columns, 1):
-            dtype = df[col].dtype
-            non_null = df[col].notna().sum()
-            pct = (non_null / len(df)) * 100 if len(df) > 0 else 0
-            print(f"  {i:3d}. {col:30s} ({dtype}) - {non_null:,} non-null ({pct:.1f}%)")
+        print(f"\nColumns ({tbl.num_columns}):")
+        # Null counts come from Arrow's validity-bitmap metadata
+        null_counts = {field.name: tbl.column(field.name).null_count for field in tbl.schema}
+        lines = []
+        for i, field in enumerate(tbl.schema, 1):
+            non_null = tbl.num_rows - null_counts[field.name]
+            pct = (non_null / tbl.num_rows) * 100 if tbl.num_rows > 0 else 0
+            lines.append(f"  {i:3d}. {field.name:30s} ({field.type}) - {non_null:,} non-null ({pct:.1f}%)")
+        print("\n".join(lines))
         
         print(f"\nSample data (first 2 rows):")
-        print(df.head(2).to_string())
+        print(tbl.slice(0, 2).to_pandas().to_string())
         
         # Check for key columns
         key_cols = ['player_id', 'gsis_id', 'player_name', 'player', 'season', 'week', 'team', 'position']
-        found_keys = [col for col in key_cols if col in df.columns]
+        found_keys = [col for col in key_cols if col in tbl.column_names]
         if found_keys:
             print(f"\nKey identifier columns found: {found_keys}")
         
-        return df
+        return tbl
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -73,31 +75,40 @@ def explore_stat_type(stat_type, season=2024):
 # Common stat_types for NextGen Stats
 stat_types = ['receiving', 'rushing', 'passing']
 
-print("="*80)
+print(BANNER)
 print("NEXTGEN STATS EXPLORATION")
-print("="*80)
+print(BANNER)
 print("\nNextGen Stats typically requires a stat_type parameter.")
 print("Common stat_types: receiving, rushing, passing")
 
+# Resolve the loader and its signature once for all stat_types
+mod = import_library()
+func, func_name = resolve_dataset_callable(mod, "nextgen_stats")
+params = list(inspect.signature(func).parameters.keys())
+
+# Downloads run concurrently; output is still printed in stat_types order
 results = {}
-for stat_type in stat_types:
-    df = explore_stat_type(stat_type)
-    if df is not None:
-        results[stat_type] = df
+with ThreadPoolExecutor(max_workers=len(stat_types)) as executor:
+    loads = {st: executor.submit(load_stat_type, func, params, st) for st in stat_types}
+    for stat_type in stat_types:
+        tbl = explore_stat_type(stat_type, loads[stat_type], func_name, params)
+        if tbl is not None:
+            results[stat_type] = tbl
 
 # Summary
-print("\n" + "="*80)
+print("\n" + BANNER)
 print("SUMMARY")
-print("="*80)
-for stat_type, df in results.items():
+print(BANNER)
+for stat_type, tbl in results.items():
     print(f"\n{stat_type.upper()}:")
-    print(f"  Rows: {len(df):,}")
-    print(f"  Columns: {len(df.columns)}")
-    if 'player_id' in df.columns or 'gsis_id' in df.columns:
-        player_col = 'player_id' if 'player_id' in df.columns else 'gsis_id'
-        print(f"  Unique players: {df[player_col].nunique():,}")
-    if 'season' in df.columns:
-        print(f"  Seasons: {sorted(df['season'].unique())}")
+    print(f"  Rows: {tbl.num_rows:,}")
+    print(f"  Columns: {tbl.num_columns}")
+    pl_df = pl.from_arrow(tbl)
+    if 'player_id' in pl_df.columns or 'gsis_id' in pl_df.columns:
+        player_col = 'player_id' if 'player_id' in pl_df.columns else 'gsis_id'
+        print(f"  Unique players: {pl_df.get_column(player_col).drop_nulls().n_unique():,}")
+    if 'season' in pl_df.columns:
+        print(f"  Seasons: {pl_df.get_column('season').unique().sort().to_list()}")
 
 
 
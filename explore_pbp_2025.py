@@ -1,64 +1,64 @@
-import nflreadpy
-import pandas as pd
+import polars as pl
 
-print("Exploring 2025 PBP data for route calculation...\n")
-
-# Load 2025 PBP data
-pbp_raw = nflreadpy.load_pbp(seasons=[2025])
-print(f"Loaded {len(pbp_raw)} plays for 2025")
-print(f"Type: {type(pbp_raw)}")
+from nflread_adapter import nflverse_parquet_url
 
-# Convert to pandas if it's Polars
-if hasattr(pbp_raw, 'to_pandas'):
-    pbp = pbp_raw.to_pandas()
-else:
-    pbp = pbp_raw
+print("Exploring 2025 PBP data for route calculation...\n")
 
-# Filter to pass plays only
-pass_plays = pbp[pbp['play_type'] == 'pass']
-print(f"Pass plays: {len(pass_plays)}")
+# Scan 2025 PBP lazily; columns are only read when selected below
+pbp_lf = pl.scan_parquet(nflverse_parquet_url("pbp", 2025))
+pbp_columns = pbp_lf.collect_schema().names()
+print(f"PBP columns: {len(pbp_columns)}")
 
 # Look for receiver-related columns
-receiver_cols = [c for c in pbp.columns if any(x in c.lower() for x in ['receiver', 'target', 'route', 'snap', 'personnel'])]
+receiver_cols = [c for c in pbp_columns if any(x in c.lower() for x in ['receiver', 'target', 'route', 'snap', 'personnel'])]
 print(f"\nReceiver-related columns: {receiver_cols}")
 
 # Check for player ID columns
-player_cols = [c for c in pbp.columns if 'player' in c.lower() or '_id' in c.lower()]
+player_cols = [c for c in pbp_columns if 'player' in c.lower() or '_id' in c.lower()]
 print(f"\nPlayer-related columns (first 30): {player_cols[:30]}")
 
+interesting_cols = sorted(c for c in pbp_columns if any(x in c.lower() for x in
+    ['receiver', 'target', 'passer', 'rusher', 'player', 'personnel', 'offense', 'defense', 'formation']))[:40]
+key_cols = [c for c in ['receiver_player_id', 'passer_player_id', 'offense_personnel'] if c in pbp_columns]
+
+# Only the columns inspected below are fetched from the parquet file
+pbp = pbp_lf.select(list(dict.fromkeys(['play_type'] + key_cols + interesting_cols))).collect()
+print(f"\nLoaded {len(pbp)} plays for 2025")
+
+# Filter to pass plays only
+pass_plays = pbp.filter(pl.col('play_type') == 'pass')
+print(f"Pass plays: {len(pass_plays)}")
+
 # Look at a sample pass play
 print("\nSample pass play - interesting columns:")
-sample = pass_plays.iloc[0]
-interesting_cols = [c for c in pbp.columns if any(x in c.lower() for x in 
-    ['receiver', 'target', 'passer', 'rusher', 'player', 'personnel', 'offense', 'defense', 'formation'])]
+sample = pass_plays.select(interesting_cols).row(0, named=True)
 
-for col in sorted(interesting_cols)[:40]:
+for col in interesting_cols:
     value = sample[col]
-    if pd.notna(value) and value != '':
+    if value is not None and value != '':
         print(f"  {col}: {value}")
 
 # Check specific columns that might help
 print("\n=== Key Columns for Route Calculation ===")
 
-if 'receiver_player_id' in pbp.columns:
+if 'receiver_player_id' in pbp_columns:
     print(f"\n✓ receiver_player_id found!")
-    non_null = pbp['receiver_player_id'].notna().sum()
+    non_null = len(pbp) - pbp['receiver_player_id'].null_count()
     print(f"  Non-null values: {non_null} ({non_null/len(pbp)*100:.1f}%)")
-    print(f"  Sample values: {pbp['receiver_player_id'].dropna().unique()[:5].tolist()}")
+    print(f"  Sample values: {pbp['receiver_player_id'].drop_nulls().unique(maintain_order=True).head(5).to_list()}")
 
-if 'passer_player_id' in pbp.columns:
+if 'passer_player_id' in pbp_columns:
     print(f"\n✓ passer_player_id found!")
-    pass_non_null = pbp['passer_player_id'].notna().sum()
+    pass_non_null = len(pbp) - pbp['passer_player_id'].null_count()
     print(f"  Non-null values: {pass_non_null}")
 
 # Check personnel / formation
-if 'offense_personnel' in pbp.columns:
+if 'offense_personnel' in pbp_columns:
     print(f"\n✓ offense_personnel found!")
-    print(f"  Sample values: {pbp['offense_personnel'].dropna().unique()[:5].tolist()}")
-    
+    print(f"  Sample values: {pbp['offense_personnel'].drop_nulls().unique(maintain_order=True).head(5).to_list()}")
+
 print("\n=== Analysis ===")
 print("Can we identify receivers on pass plays?")
-if 'receiver_player_id' in pbp.columns:
-    targeted = pass_plays['receiver_player_id'].notna().sum()
+if 'receiver_player_id' in pbp_columns:
+    targeted = len(pass_plays) - pass_plays['receiver_player_id'].null_count()
     print(f"  Pass plays with receiver_player_id: {targeted}/{len(pass_plays)} ({targeted/len(pass_plays)*100:.1f}%)")
-
@@ -0,0 +1,32 @@
+"""
+Shared HTTP clients for the API check scripts (test_*.py, check_api_*.py)
+Connections are pooled and kept alive across requests instead of being
+opened and closed per call.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+POOL_MAXSIZE = 16
+MAX_RETRIES = 3
+
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=Retry(total=MAX_RETRIES, backoff_factor=0.5))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+def async_client(**kwargs) -> "httpx.AsyncClient":
+    """httpx.AsyncClient with the same pool size and connect retries as SESSION"""
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx is required for async requests: pip install -r requirements-dev.txt")
+    transport = httpx.AsyncHTTPTransport(
+        retries=MAX_RETRIES, limits=httpx.Limits(max_connections=POOL_MAXSIZE)
+    )
+    return httpx.AsyncClient(transport=transport, **kwargs)
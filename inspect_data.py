@@ -1,18 +1,24 @@
 import nflreadpy
 import pandas as pd
+import polars as pl
 
 print("Loading player stats...")
 df = nflreadpy.load_player_stats(seasons=[2024])
+if isinstance(df, pd.DataFrame):
+    df = pl.from_pandas(df)
 
 print(f"\nDataframe shape: {df.shape}")
 print(f"\nColumn names (first 20):")
-print(list(df.columns[:20]))
+print(df.columns[:20])
 
 print(f"\nColumn dtypes (first 10):")
-print(df.dtypes.head(10))
+print("\n".join(f"{name:30s} {dtype}" for name, dtype in list(df.schema.items())[:10]))
 
+# One-row slice of the first 20 columns; values keep their own types
 print(f"\nFirst row:")
-print(df.iloc[0].head(20))
+first_row = df.head(1).select(df.columns[:20]).row(0, named=True)
+print("\n".join(f"{name:30s} {value}" for name, value in first_row.items()))
 
 print(f"\nSample data:")
-print(df[['player_display_name', 'recent_team', 'position', 'fantasy_points_ppr']].head(10))
+sample_cols = ['player_display_name', 'recent_team', 'team', 'position', 'fantasy_points_ppr']
+print(df.select([c for c in sample_cols if c in df.columns]).head(10))
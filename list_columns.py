@@ -9,5 +9,4 @@ if isinstance(df, list):
 
 print(f"\nDataframe shape: {df.shape}")
 print(f"\nAll column names:")
-for col in sorted(df.columns.tolist()):
-    print(f"  - {col}")
+print("\n".join(f"  - {col}" for col in sorted(df.columns)))
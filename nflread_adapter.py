@@ -4,11 +4,19 @@
 """
 
 import os
+import functools
+import hashlib
 import importlib
 import inspect
+import time
+from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import polars as pl
+import polars.selectors as cs
+import pyarrow as pa
 
 
 # Candidate import names for the library. Users can override via env var NFLREADPY_MODULE.
@@ -62,6 +70,34 @@ DATASET_CANDIDATES: Dict[str, List[str]] = {
 }
 
 
+# nflverse release assets (what nflreadpy downloads) for datasets published as
+# one parquet file per season. These can be scanned lazily so only the needed
+# columns and row groups are fetched.
+NFLVERSE_RELEASES_URL = "https://github.com/nflverse/nflverse-data/releases/download/"
+SEASON_PARQUET_PATHS: Dict[str, str] = {
+    "pbp": "pbp/play_by_play_{season}.parquet",
+    "player_stats": "stats_player/stats_player_week_{season}.parquet",
+    "weekly": "stats_player/stats_player_week_{season}.parquet",
+    "participation": "pbp_participation/pbp_participation_{season}.parquet",
+    "snap_counts": "snap_counts/snap_counts_{season}.parquet",
+    "ftn_charting": "ftn_charting/ftn_charting_{season}.parquet",
+    "rosters": "rosters/roster_{season}.parquet",
+    "injuries": "injuries/injuries_{season}.parquet",
+}
+
+
+# Local parquet copies of downloaded datasets, reused across sessions/processes
+DATASET_CACHE_DIR = Path(
+    os.getenv("NFL_DATAMANS_CACHE_DIR", str(Path.home() / ".cache" / "nfl-datamans"))
+)
+DATASET_CACHE_TTL_SECONDS = int(os.getenv("NFL_DATAMANS_CACHE_TTL", str(24 * 3600)))
+CACHE_ROW_GROUP_SIZE = 64_000
+
+
+# Default-resolved library, as (NFLREADPY_MODULE value, module)
+_LIB: Optional[Tuple[Optional[str], Any]] = None
+
+
 def import_library(preferred: Optional[str] = None):
     """Import the nflreadpy/nflreadr module, optionally honoring a preferred name or env var.
 
@@ -69,17 +105,41 @@ def import_library(preferred: Optional[str] = None):
     - preferred (argument)
     - NFLREADPY_MODULE (env var)
     - DEFAULT_MODULE_CANDIDATES list
+
+    Without ``preferred`` the module is resolved once per process (and again
+    only if NFLREADPY_MODULE changes); see clear_library_cache().
     """
+    global _LIB
+    env_name = os.getenv("NFLREADPY_MODULE")
+    if not preferred:
+        if _LIB is None or _LIB[0] != env_name:
+            _LIB = (env_name, _import_first(_candidate_names(None, env_name)))
+        return _LIB[1]
+    return _import_first(_candidate_names(preferred, env_name))
+
+
+def clear_library_cache() -> None:
+    """Forget resolved library modules so the next import_library() re-imports."""
+    global _LIB
+    _LIB = None
+    _import_first.cache_clear()
+
+
+def _candidate_names(preferred: Optional[str], env_name: Optional[str]) -> Tuple[str, ...]:
     names: List[str] = []
     if preferred:
         names.append(preferred)
-    env_name = os.getenv("NFLREADPY_MODULE")
     if env_name and env_name not in names:
         names.append(env_name)
     for candidate in DEFAULT_MODULE_CANDIDATES:
         if candidate not in names:
             names.append(candidate)
+    return tuple(names)
+
 
+@functools.lru_cache(maxsize=None)
+def _import_first(names: Tuple[str, ...]):
+    # Memoized per candidate list; failures raise and are not cached
     last_err: Optional[BaseException] = None
     for name in names:
         try:
@@ -88,7 +148,7 @@ def import_library(preferred: Optional[str] = None):
             last_err = exc
             continue
     raise ImportError(
-        f"Could not import any nflreadpy module from {names}. Last error: {last_err}"
+        f"Could not import any nflreadpy module from {list(names)}. Last error: {last_err}"
     )
 
 
@@ -100,8 +160,13 @@ def _first_callable(module: Any, names: Iterable[str]) -> Tuple[Callable[..., An
     raise AttributeError("None of the candidate function names exist on the module.")
 
 
+@functools.lru_cache(maxsize=None)
 def resolve_dataset_callable(module: Any, dataset: str) -> Tuple[Callable[..., Any], str]:
-    """Return the callable and its name for a given logical dataset key."""
+    """Return the callable and its name for a given logical dataset key.
+
+    Results are memoized per (module, dataset); call
+    ``resolve_dataset_callable.cache_clear()`` after patching module attributes.
+    """
     if dataset not in DATASET_CANDIDATES:
         raise KeyError(
             f"Unknown dataset '{dataset}'. Options: {sorted(DATASET_CANDIDATES.keys())}"
@@ -119,23 +184,56 @@ def resolve_dataset_callable(module: Any, dataset: str) -> Tuple[Callable[..., A
         raise
 
 
-def _coerce_to_dataframe(obj: Any) -> pd.DataFrame:
-    # If object already a pandas DataFrame
+# Return types accepted by call_dataset(backend=...)
+BACKENDS: Tuple[str, ...] = ("pandas", "polars", "arrow")
+
+
+def _polars_to_pandas(df: pl.DataFrame) -> pd.DataFrame:
+    # Temporal/categorical columns become strings, matching what the API has
+    # always serialized, then hand off through Arrow with numpy-backed dtypes.
+    to_str = df.select(cs.temporal() | cs.categorical() | cs.enum()).columns
+    if to_str:
+        df = df.with_columns(pl.col(to_str).cast(pl.String))
+    return df.to_pandas(use_pyarrow_extension_array=False)
+
+
+def _coerce(obj: Any, backend: str = "pandas") -> Any:
+    """Convert a loader result to the requested backend without extra copies.
+
+    - "polars": Polars DataFrame/LazyFrame are returned untouched
+    - "arrow": pyarrow.Table
+    - "pandas": pandas DataFrame (materialized only here)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Options: {list(BACKENDS)}")
+
+    if backend == "polars":
+        if isinstance(obj, (pl.DataFrame, pl.LazyFrame)):
+            return obj
+        if isinstance(obj, pa.Table):
+            return pl.from_arrow(obj)
+        if isinstance(obj, pd.DataFrame):
+            return pl.from_pandas(obj)
+        return pl.DataFrame(obj)
+
+    if isinstance(obj, pl.LazyFrame):
+        obj = obj.collect()
+
+    if backend == "arrow":
+        if isinstance(obj, pa.Table):
+            return obj
+        if isinstance(obj, pl.DataFrame):
+            return obj.to_arrow()
+        if not isinstance(obj, pd.DataFrame):
+            obj = pd.DataFrame(obj)
+        return pa.Table.from_pandas(obj, preserve_index=False)
+
+    # pandas
     if isinstance(obj, pd.DataFrame):
         return obj
-    
-    # Polars DataFrame: use write_csv + read_csv as fallback for compatibility
-    if hasattr(obj, 'write_csv') and hasattr(obj, 'columns'):
-        try:
-            # Get column names from Polars
-            import io
-            csv_buffer = io.StringIO()
-            obj.write_csv(csv_buffer)
-            csv_buffer.seek(0)
-            return pd.read_csv(csv_buffer)
-        except Exception:  # noqa: BLE001
-            pass
-    
+    if isinstance(obj, pl.DataFrame):
+        return _polars_to_pandas(obj)
+
     # Try to_pandas if available
     to_pandas = getattr(obj, "to_pandas", None)
     if callable(to_pandas):
@@ -143,16 +241,98 @@ def _coerce_to_dataframe(obj: Any) -> pd.DataFrame:
             return to_pandas()
         except Exception:  # noqa: BLE001
             pass
-            
+
     # Fall back to constructing a DataFrame
     return pd.DataFrame(obj)
 
 
+# Heavily repeated string columns worth dictionary-encoding
+CATEGORICAL_COLUMNS: Tuple[str, ...] = (
+    "player_display_name",
+    "team",
+    "recent_team",
+    "position",
+    "play_type",
+    "posteam",
+)
+
+
+def encode_categoricals(df: Any, columns: Iterable[str] = CATEGORICAL_COLUMNS) -> Any:
+    """Dictionary-encode the given string columns of a pandas or Polars frame.
+
+    Group-bys and membership tests then hash integer codes instead of strings.
+    Polars categories are global, so read distinct values with ``unique()``
+    rather than ``cat.get_categories()``.
+    """
+    if isinstance(df, pl.DataFrame):
+        present = [c for c, dtype in df.schema.items() if c in columns and dtype == pl.String]
+        return df.with_columns(pl.col(present).cast(pl.Categorical)) if present else df
+    if isinstance(df, pd.DataFrame):
+        present = [c for c in columns if c in df.columns and df[c].dtype == object]
+        return df.astype({c: "category" for c in present}) if present else df
+    return df
+
+
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+_INT32_MIN, _INT32_MAX = int(np.iinfo(np.int32).min), int(np.iinfo(np.int32).max)
+
+
+def downcast_numeric(df: Any) -> Any:
+    """Narrow 64-bit numeric columns to float32/int32 where values fit.
+
+    Floats beyond float32 range and ints outside int32 are left as-is.
+    """
+    if isinstance(df, pl.DataFrame):
+        floats = [c for c, dtype in df.schema.items() if dtype == pl.Float64]
+        ints = [c for c, dtype in df.schema.items() if dtype == pl.Int64]
+        if not floats and not ints:
+            return df
+        bounds = df.select(
+            [pl.col(c).abs().max().alias(f"{c}__absmax") for c in floats]
+            + [pl.col(c).min().alias(f"{c}__min") for c in ints]
+            + [pl.col(c).max().alias(f"{c}__max") for c in ints]
+        ).row(0, named=True)
+        casts = [
+            pl.col(c).cast(pl.Float32)
+            for c in floats
+            if (bounds[f"{c}__absmax"] or 0.0) <= _FLOAT32_MAX
+        ] + [
+            pl.col(c).cast(pl.Int32)
+            for c in ints
+            if _INT32_MIN <= (bounds[f"{c}__min"] or 0) and (bounds[f"{c}__max"] or 0) <= _INT32_MAX
+        ]
+        return df.with_columns(casts) if casts else df
+    if isinstance(df, pd.DataFrame):
+        out = df.copy(deep=False)
+        for c in out.select_dtypes(include="float64").columns:
+            if not (out[c].abs().max() > _FLOAT32_MAX):
+                out[c] = out[c].astype(np.float32)
+        # int32 like the Polars path; narrower ints would overflow in later sums
+        for c in out.select_dtypes(include="int64").columns:
+            if len(out) == 0 or (_INT32_MIN <= out[c].min() and out[c].max() <= _INT32_MAX):
+                out[c] = out[c].astype(np.int32)
+        return out
+    return df
+
+
+_SIGNATURES: Dict[Callable[..., Any], Optional[inspect.Signature]] = {}
+
+
+def _signature(func: Callable[..., Any]) -> Optional[inspect.Signature]:
+    """inspect.signature(func), memoized; None if it cannot be introspected."""
+    if func not in _SIGNATURES:
+        try:
+            _SIGNATURES[func] = inspect.signature(func)
+        except (TypeError, ValueError):
+            _SIGNATURES[func] = None
+    return _SIGNATURES[func]
+
+
+@functools.lru_cache(maxsize=None)
 def _best_seasons_param_name(func: Callable[..., Any]) -> Optional[str]:
     """Heuristically choose the parameter name for seasons/years."""
-    try:
-        sig = inspect.signature(func)
-    except (TypeError, ValueError):
+    sig = _signature(func)
+    if sig is None:
         return None
     candidates = ["seasons", "season", "years", "year"]
     for nm in candidates:
@@ -165,25 +345,28 @@ def call_dataset(
     module: Any,
     dataset: str,
     seasons: Optional[Iterable[int]] = None,
+    backend: str = "pandas",
     **kwargs: Any,
-) -> Tuple[pd.DataFrame, str]:
+) -> Tuple[Any, str]:
     """Call the appropriate function for a dataset and return (DataFrame, function_name).
 
     - Attempts to pass seasons/years if the target function supports it.
     - Additional kwargs are forwarded only if the function accepts them.
+    - backend selects the returned frame type: "pandas" (default), "polars"
+      (nflreadpy's native frame, no copy) or "arrow".
     """
     func, func_name = resolve_dataset_callable(module, dataset)
 
     call_kwargs: Dict[str, Any] = {}
 
     # Respect function signature
-    try:
-        sig = inspect.signature(func)
+    sig = _signature(func)
+    if sig is not None:
         param_names = set(sig.parameters.keys())
         has_var_kw = any(
             p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
         )
-    except (TypeError, ValueError):
+    else:
         param_names = set()
         has_var_kw = True  # assume permissive if signature not introspectable
 
@@ -215,10 +398,163 @@ def call_dataset(
             call_kwargs["level"] = "weekly"
 
     result = func(**call_kwargs)
-    df = _coerce_to_dataframe(result)
+    df = _coerce(result, backend=backend)
     return df, func_name
 
 
+def _module_version(module: Any) -> str:
+    version = getattr(module, "__version__", None)
+    if version is None:
+        try:
+            from importlib.metadata import version as dist_version
+
+            version = dist_version(module.__name__)
+        except Exception:  # noqa: BLE001
+            version = "unknown"
+    return str(version)
+
+
+def dataset_cache_path(
+    module: Any,
+    dataset: str,
+    seasons: Optional[Iterable[int]] = None,
+    **kwargs: Any,
+) -> Path:
+    """Return the local parquet cache file for a dataset call.
+
+    The key covers the library name and version, so upgrading the library
+    invalidates previously cached files.
+    """
+    key = repr(
+        (
+            module.__name__,
+            _module_version(module),
+            dataset,
+            tuple(sorted(seasons)) if seasons is not None else None,
+            tuple(sorted((k, repr(v)) for k, v in kwargs.items())),
+        )
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return DATASET_CACHE_DIR / dataset / f"{digest}.parquet"
+
+
+def _cache_is_fresh(path: Path) -> bool:
+    try:
+        return (time.time() - path.stat().st_mtime) < DATASET_CACHE_TTL_SECONDS
+    except OSError:
+        return False
+
+
+def call_dataset_cached(
+    module: Any,
+    dataset: str,
+    seasons: Optional[Iterable[int]] = None,
+    backend: str = "pandas",
+    columns: Optional[List[str]] = None,
+    **kwargs: Any,
+) -> Tuple[Any, str]:
+    """call_dataset backed by a local ZSTD parquet copy of the result.
+
+    On a miss (or once the file is older than DATASET_CACHE_TTL_SECONDS) the
+    dataset is downloaded via call_dataset and written to disk; hits are a
+    local parquet read. Falls back to call_dataset if the cache is unusable.
+    ``columns`` narrows the result (missing names are ignored); on a hit only
+    those column chunks are read from the file. The full dataset is cached.
+    """
+    seasons_list = list(seasons) if seasons is not None else None
+    path = dataset_cache_path(module, dataset, seasons_list, **kwargs)
+
+    if _cache_is_fresh(path):
+        _, func_name = resolve_dataset_callable(module, dataset)
+        return _coerce(_collect_selection(pl.scan_parquet(path), columns, None), backend=backend), func_name
+
+    df, func_name = call_dataset(module, dataset, seasons=seasons_list, backend="polars", **kwargs)
+    if isinstance(df, pl.LazyFrame):
+        df = df.collect()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        df.write_parquet(
+            tmp_path,
+            compression="zstd",
+            statistics=True,
+            row_group_size=CACHE_ROW_GROUP_SIZE,
+        )
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # read-only or full disk: serve the freshly downloaded frame
+    if columns:
+        df = _collect_selection(df.lazy(), columns, None)
+    return _coerce(df, backend=backend), func_name
+
+
+def nflverse_parquet_url(dataset: str, season: int) -> str:
+    """Return the nflverse release URL of a dataset's parquet file for one season."""
+    if dataset not in SEASON_PARQUET_PATHS:
+        raise KeyError(
+            f"No per-season parquet file for '{dataset}'. Options: {sorted(SEASON_PARQUET_PATHS)}"
+        )
+    return NFLVERSE_RELEASES_URL + SEASON_PARQUET_PATHS[dataset].format(season=season)
+
+
+def call_dataset_lazy(
+    module: Any,
+    dataset: str,
+    seasons: Iterable[int],
+    columns: Optional[List[str]] = None,
+    filters: Optional[pl.Expr] = None,
+    transform: Optional[Callable[[pl.LazyFrame], pl.LazyFrame]] = None,
+) -> pl.DataFrame:
+    """Load a dataset as Polars with projection and predicate pushdown.
+
+    Scans the local dataset cache when it is fresh, otherwise the same
+    nflverse parquet files the library downloads, so only the requested
+    columns (and row groups that can match ``filters``) are read.
+    Datasets without a per-season parquet file, or scans that fail, fall back
+    to call_dataset and apply the same selection in memory.
+
+    ``transform`` extends the lazy plan (e.g. a group_by) before the
+    streaming collect, so aggregations run chunk-wise over the scan.
+    """
+    seasons_list = list(seasons)
+    lf: Optional[pl.LazyFrame] = None
+    cache_path = dataset_cache_path(module, dataset, seasons_list)
+    if _cache_is_fresh(cache_path):
+        lf = pl.scan_parquet(cache_path)
+    elif dataset in SEASON_PARQUET_PATHS and seasons_list:
+        # Seasons may add/retype columns; diagonal_relaxed reconciles them
+        lf = pl.concat(
+            [pl.scan_parquet(nflverse_parquet_url(dataset, s)) for s in seasons_list],
+            how="diagonal_relaxed",
+        )
+    frame: Optional[pl.DataFrame] = None
+    if lf is not None:
+        try:
+            frame = _collect_selection(lf, columns, filters, transform)
+        except (pl.exceptions.PolarsError, OSError):
+            frame = None
+    if frame is None:
+        df, _ = call_dataset_cached(module, dataset, seasons=seasons_list, backend="polars")
+        frame = _collect_selection(df.lazy(), columns, filters, transform)
+    return frame
+
+
+def _collect_selection(
+    lf: pl.LazyFrame,
+    columns: Optional[List[str]],
+    filters: Optional[pl.Expr],
+    transform: Optional[Callable[[pl.LazyFrame], pl.LazyFrame]] = None,
+) -> pl.DataFrame:
+    if filters is not None:
+        lf = lf.filter(filters)
+    if columns:
+        present = set(lf.collect_schema().names())
+        lf = lf.select([c for c in columns if c in present])
+    if transform is not None:
+        lf = transform(lf)
+    return lf.collect(engine="streaming")
+
+
 def available_dataset_functions(module: Any) -> Dict[str, Optional[str]]:
     """Return which function name (if any) is available for each dataset key."""
     out: Dict[str, Optional[str]] = {}
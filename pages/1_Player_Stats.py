@@ -14,6 +14,7 @@ from utils import (
     get_library_module,
     load_dataset_cached,
     _first_present,
+    _lower_map,
     _compute_fantasy_points,
     _compute_shares_and_adv_metrics,
     _present_filters,
@@ -77,12 +78,13 @@ def _render_player_stats(df: pd.DataFrame, module_name: str, seasons: List[int])
     st.subheader("Analysis")
 
     # Column detection
-    season_col = _first_present(df, ["season", "year"]) or "season"
-    week_col = _first_present(df, ["week"])  # optional
-    player_col = _first_present(df, ["player", "player_name", "name", "full_name"]) or "player"
-    pos_col = _first_present(df, ["position", "pos", "player_position"])  # optional
-    team_col = _first_present(df, ["team", "recent_team", "team_abbr", "abbr", "club_code"])  # optional
-    opp_col = _first_present(df, ["opponent_team", "opp_team", "opponent", "opp", "opp_abbr"])  # optional
+    lower = _lower_map(df)
+    season_col = _first_present(df, ["season", "year"], lower) or "season"
+    week_col = _first_present(df, ["week"], lower)  # optional
+    player_col = _first_present(df, ["player", "player_name", "name", "full_name"], lower) or "player"
+    pos_col = _first_present(df, ["position", "pos", "player_position"], lower)  # optional
+    team_col = _first_present(df, ["team", "recent_team", "team_abbr", "abbr", "club_code"], lower)  # optional
+    opp_col = _first_present(df, ["opponent_team", "opp_team", "opponent", "opp", "opp_abbr"], lower)  # optional
 
     # Scoring
     scoring = st.radio("Scoring", ["PPR", "Half-PPR", "Standard"], horizontal=True)
@@ -331,11 +333,22 @@ def _render_player_stats(df: pd.DataFrame, module_name: str, seasons: List[int])
         players = sorted([str(x) for x in df_f[player_col].dropna().unique()])
         who = st.selectbox("Select player", options=[""] + players)
         if who:
-            players_df = load_dataset_cached(module_name, "players", [])
+            cand_name_cols = ["full_name", "player", "player_name", "name"]
+            headshot_fields = [
+                "headshot_url",
+                "headshot",
+                "headshot_href",
+                "espn_headshot_url",
+                "gsis_headshot_url",
+            ]
+            profile_cols = ["position", "team", "recent_team", "height", "weight", "birth_date", "college"]
+            # Only the columns the profile shows are read from the players file
+            players_df = load_dataset_cached(
+                module_name, "players", [], columns=cand_name_cols + headshot_fields + profile_cols
+            )
 
             # Try to locate a player row by common identifiers or by name
             def _find_player_row(name: str) -> Optional[pd.Series]:
-                cand_name_cols = ["full_name", "player", "player_name", "name"]
                 for c in cand_name_cols:
                     if c in players_df.columns:
                         hit = players_df[players_df[c].astype(str).str.lower() == name.lower()]
@@ -345,13 +358,6 @@ def _render_player_stats(df: pd.DataFrame, module_name: str, seasons: List[int])
 
             prow = _find_player_row(who)
 
-            headshot_fields = [
-                "headshot_url",
-                "headshot",
-                "headshot_href",
-                "espn_headshot_url",
-                "gsis_headshot_url",
-            ]
             headshot = None
             if prow is not None:
                 for f in headshot_fields:
@@ -360,7 +366,7 @@ def _render_player_stats(df: pd.DataFrame, module_name: str, seasons: List[int])
                         break
 
             top_cols = [
-                c for c in ["position", "team", "recent_team", "height", "weight", "birth_date", "college"]
+                c for c in profile_cols
                 if prow is not None and c in players_df.columns
             ]
 
@@ -1,7 +1,15 @@
 import streamlit as st
 import pandas as pd
+import polars as pl
 import altair as alt
-from utils import load_dataset_cached, _compute_fantasy_points, _compute_shares_and_adv_metrics
+from utils import (
+    FANTASY_INPUT_COLUMNS,
+    SHARE_INPUT_COLUMNS,
+    load_dataset_lazy_cached,
+    load_players_index_cached,
+    _fantasy_points_expr,
+    _shares_and_adv_metrics_exprs,
+)
 
 st.set_page_config(page_title="Player Comparison", layout="wide")
 st.title("⚔️ Player Comparison Tool")
@@ -18,28 +26,16 @@ if not selected_years:
     st.info("Please select at least one season.")
     st.stop()
 
-with st.spinner("Loading data..."):
-    df = load_dataset_cached("nflreadpy", "player_stats", selected_years)
-
-# Process Data
-ppr = {"PPR": 1.0, "Half-PPR": 0.5, "Standard": 0.0}[scoring]
-df = _compute_fantasy_points(df, ppr=ppr).to_frame(name="fantasy_points_calc").join(df)
-df = _compute_shares_and_adv_metrics(df)
-
-# Player Selection
-all_players = sorted(df["player_display_name"].dropna().unique().tolist())
+# Player Selection from the small per-player index, not the weekly frame
+with st.spinner("Loading players..."):
+    players_index = load_players_index_cached("nflreadpy", selected_years)
+all_players = players_index.get_column("player_display_name").unique(maintain_order=True).to_list()
 selected_players = st.multiselect("Select Players to Compare (Max 5)", options=all_players, max_selections=5)
 
 if not selected_players:
     st.info("Select players to see their comparison.")
     st.stop()
 
-# Filter Data
-player_data = df[df["player_display_name"].isin(selected_players)].copy()
-
-# Aggregation Choice
-agg_type = st.radio("Aggregation", ["Season Total", "Weekly Average"], horizontal=True)
-
 # Metrics to compare
 comparison_metrics = {
     "Fantasy Points": "fantasy_points_calc",
@@ -54,17 +50,52 @@ comparison_metrics = {
     "WOPR": "wopr",
 }
 
+# Only the columns used below are read from the season parquet files
+load_columns = list(dict.fromkeys(
+    ["player_id", "player_display_name", "season", "week"]
+    + [c for c in comparison_metrics.values() if c != "fantasy_points_calc"]
+    + FANTASY_INPUT_COLUMNS
+    + SHARE_INPUT_COLUMNS
+))
+with st.spinner("Loading data..."):
+    df = load_dataset_lazy_cached(
+        "nflreadpy", "player_stats", selected_years, columns=load_columns, categorical=True, downcast=True
+    )
+
+selected_ids = players_index.filter(pl.col("player_display_name").is_in(selected_players)).get_column("player_id")
+
+# Process Data: filter, fantasy points and derived shares as one lazy plan
+ppr = {"PPR": 1.0, "Half-PPR": 0.5, "Standard": 0.0}[scoring]
+player_lf = (
+    df.lazy()
+    .filter(pl.col("player_id").is_in(selected_ids.implode()))
+    .with_columns(pl.col(pl.Categorical).cast(pl.String))
+    .with_columns(fantasy_points_calc=_fantasy_points_expr(df.columns, ppr=ppr))
+)
+for stage in _shares_and_adv_metrics_exprs(df):
+    player_lf = player_lf.with_columns(stage)
+
+# Aggregation Choice
+agg_type = st.radio("Aggregation", ["Season Total", "Weekly Average"], horizontal=True)
+
 # Aggregate
 if agg_type == "Season Total":
-    agg_funcs = {v: "sum" for v in comparison_metrics.values()}
+    agg_exprs = [pl.col(v).sum() for v in comparison_metrics.values()]
     # Fix rates
-    for rate in ["target_share", "wopr"]:
-        agg_funcs[rate] = "mean"
-    
-    grouped = player_data.groupby("player_display_name")[list(comparison_metrics.values())].agg(agg_funcs).reset_index()
+    for i, v in enumerate(comparison_metrics.values()):
+        if v in ["target_share", "wopr"]:
+            agg_exprs[i] = pl.col(v).cast(pl.Float64).mean()
 else:
-    agg_funcs = {v: "mean" for v in comparison_metrics.values()}
-    grouped = player_data.groupby("player_display_name")[list(comparison_metrics.values())].agg(agg_funcs).reset_index()
+    # Averages accumulate in float64 even when the columns are downcast
+    agg_exprs = [pl.col(v).cast(pl.Float64).mean() for v in comparison_metrics.values()]
+
+grouped_lf = player_lf.group_by("player_display_name").agg(agg_exprs).sort("player_display_name")
+
+# Weekly rows and the aggregate share the filter/derivation subplan
+player_data, grouped = (
+    frame.to_pandas(use_pyarrow_extension_array=False)
+    for frame in pl.collect_all([player_lf, grouped_lf])
+)
 
 # Transpose for side-by-side view
 st.subheader("Side-by-Side Comparison")
@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
-from utils import load_dataset_cached, _compute_fantasy_points
+import polars as pl
+from nflread_adapter import call_dataset_lazy
+from utils import get_library_module, _fantasy_points_expr
 
 st.set_page_config(page_title="Leaderboards", layout="wide")
 st.title("🏆 Leaderboards")
@@ -12,29 +14,42 @@ with st.sidebar:
     week_filter = st.slider("Weeks", 1, 22, (1, 18))
     scoring = st.radio("Scoring", ["PPR", "Half-PPR", "Standard"], horizontal=True)
 
-# Load Data
-with st.spinner(f"Loading data for {season}..."):
-    df = load_dataset_cached("nflreadpy", "player_stats", [season])
+GROUP_KEYS = ["player_display_name", "player_id"]
+SUM_COLS = [
+    "passing_yards", "passing_tds", "interceptions",
+    "rushing_yards", "rushing_tds",
+    "receptions", "receiving_yards", "receiving_tds",
+    "fantasy_points_calc",
+]
+LAST_COLS = ["team", "position"]  # Approximate
 
-# Filter Weeks
-df = df[(df["week"] >= week_filter[0]) & (df["week"] <= week_filter[1])]
 
-# Calculate Fantasy
-ppr = {"PPR": 1.0, "Half-PPR": 0.5, "Standard": 0.0}[scoring]
-df["fantasy_points_calc"] = _compute_fantasy_points(df, ppr=ppr)
+@st.cache_data(show_spinner=False)
+def season_totals(season: int, week_range: tuple, ppr: float) -> pd.DataFrame:
+    """Per-player totals, aggregated by Polars' streaming engine during the scan."""
+
+    def aggregate(lf: pl.LazyFrame) -> pl.LazyFrame:
+        present = lf.collect_schema().names()
+        lf = lf.with_columns(fantasy_points_calc=_fantasy_points_expr(present, ppr=ppr))
+        # Only aggregate columns that exist
+        aggs = [pl.col(c).sum() for c in SUM_COLS if c in present or c == "fantasy_points_calc"]
+        aggs += [pl.col(c).drop_nulls().last() for c in LAST_COLS if c in present]
+        return lf.drop_nulls(GROUP_KEYS).group_by(GROUP_KEYS).agg(aggs).sort(GROUP_KEYS)
 
-# Aggregation
-agg_cols = {
-    "passing_yards": "sum", "passing_tds": "sum", "interceptions": "sum",
-    "rushing_yards": "sum", "rushing_tds": "sum",
-    "receptions": "sum", "receiving_yards": "sum", "receiving_tds": "sum",
-    "fantasy_points_calc": "sum",
-    "team": "last", "position": "last" # Approximate
-}
-# Only aggregate columns that exist
-valid_agg = {k: v for k, v in agg_cols.items() if k in df.columns}
+    totals = call_dataset_lazy(
+        get_library_module("nflreadpy"),
+        "player_stats",
+        [season],
+        filters=pl.col("week").is_between(*week_range),
+        transform=aggregate,
+    )
+    return totals.to_pandas(use_pyarrow_extension_array=False)
 
-grouped = df.groupby(["player_display_name", "player_id"], as_index=False).agg(valid_agg)
+
+# Load and aggregate (week range is applied inside the parquet scan)
+ppr = {"PPR": 1.0, "Half-PPR": 0.5, "Standard": 0.0}[scoring]
+with st.spinner(f"Loading data for {season}..."):
+    grouped = season_totals(season, tuple(week_filter), ppr)
 
 # Tabs
 tab1, tab2, tab3, tab4 = st.tabs(["Fantasy", "Passing", "Rushing", "Receiving"])
@@ -44,7 +59,8 @@ def show_leaderboard(data, sort_col, display_cols, top_n=20):
         st.warning(f"Column {sort_col} not found.")
         return
     
-    leaderboard = data.sort_values(sort_col, ascending=False).head(top_n).reset_index(drop=True)
+    # Partial sort: only the top_n rows are ordered
+    leaderboard = data.nlargest(top_n, sort_col).reset_index(drop=True)
     leaderboard.index += 1 # Rank 1-based
     
     # Format
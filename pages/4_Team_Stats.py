@@ -1,7 +1,13 @@
+import contextlib
+import os
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
+import polars as pl
 import altair as alt
-from utils import load_dataset_cached
+from nflread_adapter import DATASET_CACHE_DIR, DATASET_CACHE_TTL_SECONDS, _cache_is_fresh, call_dataset_lazy
+from utils import get_library_module
 
 st.set_page_config(page_title="Team Stats", layout="wide")
 st.title("🛡️ Team Stats Analysis")
@@ -12,24 +18,80 @@ with st.sidebar:
     season = st.selectbox("Season", options=list(range(2024, 1998, -1)), index=0)
     week_filter = st.slider("Weeks", 1, 22, (1, 18))
 
-# Load Data
-with st.spinner(f"Loading data for {season}..."):
-    df = load_dataset_cached("nflreadpy", "player_stats", [season])
+TEAM_SUM_COLS = [
+    "passing_yards",
+    "rushing_yards",
+    "passing_tds",
+    "rushing_tds",
+    "fantasy_points",  # Standard scoring usually available
+]
+
+
+def aggregate_by_team(lf: pl.LazyFrame) -> pl.LazyFrame:
+    return (
+        lf.drop_nulls("recent_team")
+        .group_by("recent_team")
+        .agg(pl.col(TEAM_SUM_COLS).sum())
+        .with_columns(
+            total_yards=pl.col("passing_yards") + pl.col("rushing_yards"),
+            total_tds=pl.col("passing_tds") + pl.col("rushing_tds"),
+        )
+        .sort("recent_team")
+    )
+
+
+def _team_weeks_path(season: int) -> Path:
+    return DATASET_CACHE_DIR / f"team_stats_{season}.arrow"
 
-# Filter Weeks
-df = df[(df["week"] >= week_filter[0]) & (df["week"] <= week_filter[1])]
 
-# Aggregate by Team
-team_stats = df.groupby("recent_team").agg({
-    "passing_yards": "sum",
-    "rushing_yards": "sum",
-    "passing_tds": "sum",
-    "rushing_tds": "sum",
-    "fantasy_points": "sum" # Standard scoring usually available
-}).reset_index()
+@st.cache_resource(show_spinner=False, max_entries=32, ttl=DATASET_CACHE_TTL_SECONDS)
+def _load_team_weeks(season: int) -> pl.DataFrame:
+    """Team totals per week for one season, persisted as Arrow IPC.
 
-team_stats["total_yards"] = team_stats["passing_yards"] + team_stats["rushing_yards"]
-team_stats["total_tds"] = team_stats["passing_tds"] + team_stats["rushing_tds"]
+    Keyed on season only; the TTL drops entries once the file may be stale.
+    """
+    path = _team_weeks_path(season)
+    if _cache_is_fresh(path):
+        return pl.read_ipc(path, memory_map=True)
+    # Column projection and group_by run in the scan
+    team_weeks = call_dataset_lazy(
+        get_library_module("nflreadpy"),
+        "player_stats",
+        [season],
+        columns=["recent_team", "week", *TEAM_SUM_COLS],
+        transform=lambda lf: (
+            lf.drop_nulls("recent_team")
+            .group_by(["recent_team", "week"])
+            .agg(pl.col(TEAM_SUM_COLS).sum())
+            .sort(["recent_team", "week"])
+        ),
+    )
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        team_weeks.write_ipc(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        # read-only or full disk: drop any partial file, serve the in-memory totals
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+    return team_weeks
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=32)
+def _compute_team_stats(season: int, wk_lo: int, wk_hi: int) -> pd.DataFrame:
+    """Team totals for one season and week range, from the per-week table."""
+    team_weeks = _load_team_weeks(season)
+    return (
+        aggregate_by_team(team_weeks.lazy().filter(pl.col("week").is_between(wk_lo, wk_hi)))
+        .collect()
+        .to_pandas(use_pyarrow_extension_array=False)
+    )
+
+
+# Load and aggregate (the week range only filters the small per-week table)
+with st.spinner(f"Loading data for {season}..."):
+    team_stats = _compute_team_stats(season, *week_filter)
 
 # Display Table
 st.subheader("Team Offense Summary")
@@ -49,13 +111,13 @@ with col1:
 
 with col2:
     st.subheader("Pass vs Rush Ratio (Yards)")
-    # Melt for stacked bar
-    melted = team_stats.melt(id_vars="recent_team", value_vars=["passing_yards", "rushing_yards"], var_name="type", value_name="yards")
-    
-    chart_ratio = alt.Chart(melted).mark_bar().encode(
-        x=alt.X("yards", stack="normalize", axis=alt.Axis(format="%"), title="Percentage of Yards"),
+    # Fold pass/rush yards into long form in Vega for the stacked bar
+    chart_ratio = alt.Chart(team_stats).transform_fold(
+        ["passing_yards", "rushing_yards"], as_=["type", "yards"]
+    ).mark_bar().encode(
+        x=alt.X("yards:Q", stack="normalize", axis=alt.Axis(format="%"), title="Percentage of Yards"),
         y=alt.Y("recent_team", sort=alt.EncodingSortField(field="yards", op="sum", order="descending"), title="Team"),
-        color=alt.Color("type", legend=alt.Legend(title="Type")),
-        tooltip=["recent_team", "type", "yards"]
+        color=alt.Color("type:N", legend=alt.Legend(title="Type")),
+        tooltip=["recent_team", "type:N", "yards:Q"]
     ).properties(height=600)
     st.altair_chart(chart_ratio, use_container_width=True)
@@ -0,0 +1,83 @@
+"""
+Route estimation: actual routes from participation vs. snaps * team pass rate.
+
+Plain functions over loaded frames, without Streamlit, so scripts such as
+validate_route_estimation.py can call them directly.
+"""
+import numpy as np
+import pandas as pd
+import polars as pl
+
+ROUTE_PBP_COLUMNS = ["game_id", "play_id", "play_type", "week", "season", "posteam"]
+ROUTE_PARTICIPATION_COLUMNS = ["nflverse_game_id", "play_id", "offense_players"]
+ROUTE_SNAP_COLUMNS = ["season", "week", "team", "player", "position", "offense_snaps"]
+
+
+def count_actual_routes(pbp: pl.DataFrame, participation: pl.DataFrame) -> pd.DataFrame:
+    """Routes per (player_id, season, week): pass plays with the player on the field."""
+    # Filter, join, split/explode and count run as one lazy plan
+    return (
+        pbp.lazy()
+        .filter(pl.col("play_type") == "pass")
+        .join(
+            participation.lazy(),
+            left_on=["game_id", "play_id"],
+            right_on=["nflverse_game_id", "play_id"],
+        )
+        .with_columns(player_id=pl.col("offense_players").cast(pl.Utf8).str.split(";"))
+        .explode("player_id")
+        .group_by(["player_id", "season", "week"])
+        .agg(pl.len().cast(pl.Int64).alias("actual_routes"))
+        .sort(["player_id", "season", "week"])
+        .collect(engine="streaming")
+        .to_pandas()
+    )
+
+
+def team_game_pass_rates(pbp: pl.DataFrame) -> pd.DataFrame:
+    """Pass plays / (pass + run plays) per (game_id, posteam), with season and week."""
+    pbp_lite = pbp.to_pandas()
+    # 0/1 flag columns keep the group sums on the native path; play types are
+    # matched by their integer category codes
+    play_type = pbp_lite["play_type"].astype("category")
+    codes = play_type.cat.codes.to_numpy()
+    pass_code, run_code = play_type.cat.categories.get_indexer(["pass", "run"])
+    is_pass = (codes == pass_code) & (pass_code >= 0)
+    is_play = is_pass | ((codes == run_code) & (run_code >= 0))
+    flags = pd.DataFrame(
+        {
+            "game_id": pbp_lite["game_id"],
+            "posteam": pbp_lite["posteam"],
+            "is_pass": is_pass.astype(np.int32),
+            "is_play": is_play.astype(np.int32),
+        }
+    )
+    game_stats = flags.groupby(["game_id", "posteam"], sort=False, observed=True).agg(
+        pass_plays=("is_pass", "sum"),
+        total_plays=("is_play", "sum"),
+    ).reset_index()
+    # 0 plays -> rate 0
+    game_stats["pass_rate"] = (game_stats["pass_plays"] / game_stats["total_plays"]).fillna(0)
+
+    game_meta = pbp_lite[["game_id", "season", "week"]].drop_duplicates()
+    return game_stats.merge(game_meta, on="game_id")
+
+
+def estimate_routes(snaps: pl.DataFrame, game_stats: pd.DataFrame) -> pd.DataFrame:
+    """Offensive WR/TE/RB snaps joined to their team's game pass rate, with estimated_routes."""
+    snaps = snaps.to_pandas()
+    off_snaps = snaps[(snaps["offense_snaps"] > 0) & (snaps["position"].isin(["WR", "TE", "RB"]))]
+    # Same categories on both join keys, so the merge compares codes
+    off_snaps = off_snaps.astype({"team": game_stats["posteam"].dtype})
+    # Snaps carry PFR game ids, so join on season/week/team instead
+    estimated = pd.merge(
+        off_snaps,
+        game_stats,
+        left_on=["season", "week", "team"],
+        right_on=["season", "week", "posteam"],
+        how="inner",
+    )
+    snaps_arr = estimated["offense_snaps"].to_numpy(dtype=np.float64)
+    rate_arr = estimated["pass_rate"].to_numpy(dtype=np.float64)
+    estimated["estimated_routes"] = np.round(snaps_arr * rate_arr, 1)
+    return estimated
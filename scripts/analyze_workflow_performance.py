@@ -8,19 +8,105 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Tuple, Any
 from datetime import datetime
 import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Below this many artifacts, process start-up costs more than serial parsing
+PARALLEL_MIN_FILES = 64
+
+# Top-level scalar fields read from each performance artifact
+PERF_FIELDS = ('position', 'filterDuration', 'maxUIBlockDuration', 'apiCallDuration')
+
+# Issue detection: (type, metric, statistic, warn above, high severity above, message)
+ISSUE_CHECKS: List[Tuple[str, str, str, float, float, str]] = [
+    ('slow_filter', 'filterDuration', 'avg', 3000, 5000,
+     "Average filter duration ({value:.0f}ms) exceeds 3s threshold"),
+    ('ui_block', 'uiBlockDuration', 'max', 500, 2000,
+     "UI thread blocked for {value:.0f}ms"),
+    ('errors', 'errorCount', 'total', 0, 0,
+     "{value} errors detected across {stats[samples_with_errors]} samples"),
+    ('slow_api', 'apiCallDuration', 'avg', 2000, float('inf'),
+     "Average API call duration ({value:.0f}ms) exceeds 2s threshold"),
+]
+
+# Report order: higher severity first, then larger value
+SEVERITY_RANK = {'high': 1, 'medium': 0}
 
 def load_json_file(filepath: Path) -> Dict[str, Any]:
     """Load JSON file safely"""
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(Path(filepath).read_bytes())
         with open(filepath, 'r') as f:
             return json.load(f)
     except Exception as e:
         print(f"⚠️  Error loading {filepath}: {e}")
         return {}
 
+def _extract_perf_fields(filepath: Path) -> Dict[str, Any]:
+    """Read only PERF_FIELDS and the number of `errors` entries from an artifact.
+
+    With ijson the document is scanned as events, so large nested arrays are
+    never built into Python objects; otherwise it falls back to a full load.
+    """
+    if not IJSON_AVAILABLE:
+        data = load_json_file(filepath)
+        if not isinstance(data, dict):
+            return {}
+        fields = {k: data[k] for k in PERF_FIELDS if k in data}
+        fields['error_count'] = len(data.get('errors', []))
+        return fields
+    
+    fields: Dict[str, Any] = {'error_count': 0}
+    try:
+        with open(filepath, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix in PERF_FIELDS and event not in ('start_map', 'start_array', 'end_map', 'end_array', 'map_key'):
+                    fields[prefix] = value
+                elif prefix == 'errors.item' and event not in ('end_map', 'end_array', 'map_key'):
+                    fields['error_count'] += 1
+    except Exception as e:
+        print(f"⚠️  Error loading {filepath}: {e}")
+        return {}
+    return fields
+
+def _summarize(values) -> Dict[str, float]:
+    """min/max/avg/median of a sequence as vectorized numpy reductions"""
+    arr = np.fromiter(values, dtype=np.float64)
+    if arr.size == 0:
+        return {'min': 0, 'max': 0, 'avg': 0, 'median': 0}
+    return {
+        'min': float(arr.min()),
+        'max': float(arr.max()),
+        'avg': float(arr.mean()),
+        'median': _median(arr),
+    }
+
+def _median(arr: np.ndarray) -> float:
+    """Median by in-place quickselect of the middle element(s); reorders arr"""
+    mid = arr.size // 2
+    if arr.size % 2:
+        arr.partition(mid)
+        return float(arr[mid])
+    arr.partition((mid - 1, mid))
+    return float(0.5 * (arr[mid - 1] + arr[mid]))
+
 def analyze_performance_data(data_dir: Path) -> Dict[str, Any]:
     """Analyze performance data from workflow artifacts"""
     results = {
@@ -39,11 +125,15 @@ def analyze_performance_data(data_dir: Path) -> Dict[str, Any]:
     
     print(f"📊 Found {len(perf_files)} performance data files")
     
-    # Load and analyze each file
+    # Load and analyze each file (parsed across processes for large artifact sets)
     position_data = {}
-    for perf_file in perf_files:
-        data = load_json_file(perf_file)
-        
+    if len(perf_files) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(_extract_perf_fields, perf_files, chunksize=16))
+    else:
+        parsed = [_extract_perf_fields(perf_file) for perf_file in perf_files]
+    
+    for data in parsed:
         if 'position' in data:
             position = data['position']
             if position not in position_data:
@@ -56,31 +146,14 @@ def analyze_performance_data(data_dir: Path) -> Dict[str, Any]:
             continue
             
         # Calculate statistics
-        filter_durations = [d.get('filterDuration', 0) for d in datasets]
-        ui_blocks = [d.get('maxUIBlockDuration', 0) for d in datasets]
         api_durations = [d.get('apiCallDuration', 0) for d in datasets if d.get('apiCallDuration')]
-        error_counts = [len(d.get('errors', [])) for d in datasets]
+        error_counts = [d.get('error_count', 0) for d in datasets]
         
         results['positions'][position] = {
             'samples': len(datasets),
-            'filterDuration': {
-                'min': min(filter_durations) if filter_durations else 0,
-                'max': max(filter_durations) if filter_durations else 0,
-                'avg': statistics.mean(filter_durations) if filter_durations else 0,
-                'median': statistics.median(filter_durations) if filter_durations else 0
-            },
-            'uiBlockDuration': {
-                'min': min(ui_blocks) if ui_blocks else 0,
-                'max': max(ui_blocks) if ui_blocks else 0,
-                'avg': statistics.mean(ui_blocks) if ui_blocks else 0,
-                'median': statistics.median(ui_blocks) if ui_blocks else 0
-            },
-            'apiCallDuration': {
-                'min': min(api_durations) if api_durations else 0,
-                'max': max(api_durations) if api_durations else 0,
-                'avg': statistics.mean(api_durations) if api_durations else 0,
-                'median': statistics.median(api_durations) if api_durations else 0
-            },
+            'filterDuration': _summarize(d.get('filterDuration', 0) for d in datasets),
+            'uiBlockDuration': _summarize(d.get('maxUIBlockDuration', 0) for d in datasets),
+            'apiCallDuration': _summarize(api_durations),
             'errorCount': {
                 'total': sum(error_counts),
                 'avg': statistics.mean(error_counts) if error_counts else 0,
@@ -92,53 +165,22 @@ def analyze_performance_data(data_dir: Path) -> Dict[str, Any]:
         # Detect issues
         pos_results = results['positions'][position]
         
-        # Issue: Slow filter duration
-        if pos_results['filterDuration']['avg'] > 3000:
-            issue = {
-                'type': 'slow_filter',
-                'severity': 'high' if pos_results['filterDuration']['avg'] > 5000 else 'medium',
-                'message': f"Average filter duration ({pos_results['filterDuration']['avg']:.0f}ms) exceeds 3s threshold",
-                'position': position,
-                'value': pos_results['filterDuration']['avg']
-            }
-            pos_results['issues'].append(issue)
-            results['issues'].append(issue)
-        
-        # Issue: UI thread blocks
-        if pos_results['uiBlockDuration']['max'] > 500:
-            issue = {
-                'type': 'ui_block',
-                'severity': 'high' if pos_results['uiBlockDuration']['max'] > 2000 else 'medium',
-                'message': f"UI thread blocked for {pos_results['uiBlockDuration']['max']:.0f}ms",
-                'position': position,
-                'value': pos_results['uiBlockDuration']['max']
-            }
-            pos_results['issues'].append(issue)
-            results['issues'].append(issue)
-        
-        # Issue: Errors detected
-        if pos_results['errorCount']['total'] > 0:
-            issue = {
-                'type': 'errors',
-                'severity': 'high',
-                'message': f"{pos_results['errorCount']['total']} errors detected across {pos_results['errorCount']['samples_with_errors']} samples",
-                'position': position,
-                'value': pos_results['errorCount']['total']
-            }
-            pos_results['issues'].append(issue)
-            results['issues'].append(issue)
-        
-        # Issue: Slow API calls
-        if api_durations and pos_results['apiCallDuration']['avg'] > 2000:
-            issue = {
-                'type': 'slow_api',
-                'severity': 'medium',
-                'message': f"Average API call duration ({pos_results['apiCallDuration']['avg']:.0f}ms) exceeds 2s threshold",
-                'position': position,
-                'value': pos_results['apiCallDuration']['avg']
-            }
-            pos_results['issues'].append(issue)
-            results['issues'].append(issue)
+        for issue_type, metric, stat, warn, crit, message in ISSUE_CHECKS:
+            stats = pos_results[metric]
+            value = stats[stat]
+            if value > warn:
+                issue = {
+                    'type': issue_type,
+                    'severity': 'high' if value > crit else 'medium',
+                    'message': message.format(value=value, stats=stats),
+                    'position': position,
+                    'value': value
+                }
+                pos_results['issues'].append(issue)
+                results['issues'].append(issue)
+    
+    # Sorted once here; the report lists issues in this order
+    results['issues'].sort(key=lambda x: (SEVERITY_RANK[x['severity']], x['value']), reverse=True)
     
     # Generate summary
     if position_data:
@@ -166,55 +208,55 @@ def analyze_performance_data(data_dir: Path) -> Dict[str, Any]:
     
     return results
 
-def generate_report(analysis: Dict[str, Any], output_file: Path):
-    """Generate a human-readable report"""
-    report_lines = [
-        "# Performance Analysis Report",
-        f"Generated: {analysis['timestamp']}",
-        "",
-        "## Summary",
-        f"- Total Samples: {analysis['summary'].get('total_samples', 0)}",
-        f"- Positions Tested: {', '.join(analysis['summary'].get('positions_tested', []))}",
-        f"- Problematic Positions: {', '.join(analysis['summary'].get('problematic_positions', [])) or 'None'}",
-        f"- Overall Avg Filter Duration: {analysis['summary'].get('overall_avg_filter_duration', 0):.0f}ms",
-        f"- Overall Max UI Block: {analysis['summary'].get('overall_max_ui_block', 0):.0f}ms",
-        f"- Total Issues: {analysis['summary'].get('total_issues', 0)}",
-        f"  - High Severity: {analysis['summary'].get('high_severity_issues', 0)}",
-        f"  - Medium Severity: {analysis['summary'].get('medium_severity_issues', 0)}",
-        "",
-        "## Issues Detected",
-    ]
+def _iter_report_lines(analysis: Dict[str, Any]) -> Iterator[str]:
+    """Yield the markdown report line by line"""
+    summary = analysis['summary']
+    yield "# Performance Analysis Report"
+    yield f"Generated: {analysis['timestamp']}"
+    yield ""
+    yield "## Summary"
+    yield f"- Total Samples: {summary.get('total_samples', 0)}"
+    yield f"- Positions Tested: {', '.join(summary.get('positions_tested', []))}"
+    yield f"- Problematic Positions: {', '.join(summary.get('problematic_positions', [])) or 'None'}"
+    yield f"- Overall Avg Filter Duration: {summary.get('overall_avg_filter_duration', 0):.0f}ms"
+    yield f"- Overall Max UI Block: {summary.get('overall_max_ui_block', 0):.0f}ms"
+    yield f"- Total Issues: {summary.get('total_issues', 0)}"
+    yield f"  - High Severity: {summary.get('high_severity_issues', 0)}"
+    yield f"  - Medium Severity: {summary.get('medium_severity_issues', 0)}"
+    yield ""
+    yield "## Issues Detected"
     
     if analysis['issues']:
-        for issue in sorted(analysis['issues'], key=lambda x: (x['severity'] == 'high', x['value']), reverse=True):
-            report_lines.append(f"### {issue['type'].upper()} - {issue['severity'].upper()}")
-            report_lines.append(f"- Position: {issue['position']}")
-            report_lines.append(f"- Message: {issue['message']}")
-            report_lines.append(f"- Value: {issue['value']:.0f}ms" if isinstance(issue['value'], (int, float)) else f"- Value: {issue['value']}")
-            report_lines.append("")
+        for issue in analysis['issues']:
+            yield f"### {issue['type'].upper()} - {issue['severity'].upper()}"
+            yield f"- Position: {issue['position']}"
+            yield f"- Message: {issue['message']}"
+            yield f"- Value: {issue['value']:.0f}ms" if isinstance(issue['value'], (int, float)) else f"- Value: {issue['value']}"
+            yield ""
     else:
-        report_lines.append("✅ No issues detected!")
-        report_lines.append("")
+        yield "✅ No issues detected!"
+        yield ""
     
-    report_lines.append("## Position Details")
+    yield "## Position Details"
     for position, data in analysis['positions'].items():
-        report_lines.append(f"### {position}")
-        report_lines.append(f"- Samples: {data['samples']}")
-        report_lines.append(f"- Filter Duration: avg={data['filterDuration']['avg']:.0f}ms, max={data['filterDuration']['max']:.0f}ms")
-        report_lines.append(f"- UI Block Duration: avg={data['uiBlockDuration']['avg']:.0f}ms, max={data['uiBlockDuration']['max']:.0f}ms")
+        yield f"### {position}"
+        yield f"- Samples: {data['samples']}"
+        yield f"- Filter Duration: avg={data['filterDuration']['avg']:.0f}ms, max={data['filterDuration']['max']:.0f}ms"
+        yield f"- UI Block Duration: avg={data['uiBlockDuration']['avg']:.0f}ms, max={data['uiBlockDuration']['max']:.0f}ms"
         if data['apiCallDuration']['avg'] > 0:
-            report_lines.append(f"- API Call Duration: avg={data['apiCallDuration']['avg']:.0f}ms, max={data['apiCallDuration']['max']:.0f}ms")
-        report_lines.append(f"- Errors: {data['errorCount']['total']} total")
+            yield f"- API Call Duration: avg={data['apiCallDuration']['avg']:.0f}ms, max={data['apiCallDuration']['max']:.0f}ms"
+        yield f"- Errors: {data['errorCount']['total']} total"
         if data['issues']:
-            report_lines.append(f"- Issues: {len(data['issues'])}")
+            yield f"- Issues: {len(data['issues'])}"
             for issue in data['issues']:
-                report_lines.append(f"  - {issue['message']}")
-        report_lines.append("")
-    
-    report_content = "\n".join(report_lines)
-    
+                yield f"  - {issue['message']}"
+        yield ""
+
+def generate_report(analysis: Dict[str, Any], output_file: Path):
+    """Generate a human-readable report"""
+    # Lines are streamed to the file as they are produced
     with open(output_file, 'w') as f:
-        f.write(report_content)
+        f.writelines(line + "\n" for line in _iter_report_lines(analysis))
     
     print(f"✅ Report generated: {output_file}")
 
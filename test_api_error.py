@@ -1,5 +1,6 @@
 """Test API endpoint to see exact error"""
 import requests
+from http_session import SESSION
 import json
 
 url = "http://127.0.0.1:8000/v1/data/player_stats?seasons=2025&limit=1&include_ngs=true&ngs_stat_type=receiving"
@@ -8,7 +9,7 @@ print("Testing API endpoint...")
 print(f"URL: {url}\n")
 
 try:
-    response = requests.get(url, timeout=60)
+    response = SESSION.get(url, timeout=60)
     print(f"Status Code: {response.status_code}")
     print(f"Headers: {dict(response.headers)}\n")
     
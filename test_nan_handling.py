@@ -1,9 +1,17 @@
 import nflreadpy
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 df = nflreadpy.load_player_stats(seasons=[2024])
+if not isinstance(df, pd.DataFrame):
+    df = df.to_pandas()  # nflreadpy returns Polars; the API serializes pandas frames
 print("Original columns:", list(df.columns[:10]))
 
 # Test different approaches
@@ -25,3 +33,11 @@ df3 = df3.astype(object).where(pd.notnull(df3), None)
 records3 = df3.to_dict(orient="records")
 print("Columns after where:", list(df3.columns[:10]))
 print(json.dumps(records3[0], default=str)[:200])
+
+print("\n4. PyArrow to_pylist (NaN -> None, no object-dtype copy):")
+records4 = pa.Table.from_pandas(df.head(2), preserve_index=False).to_pylist()
+if orjson is not None:
+    # orjson writes the remaining +/-inf as null
+    print(orjson.dumps(records4[0], option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode()[:200])
+else:
+    print(json.dumps(records4[0], default=str)[:200])
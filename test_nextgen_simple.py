@@ -1,7 +1,9 @@
 """Simple test of NextGen Stats"""
-import pandas as pd
 from nflread_adapter import import_library, call_dataset
 
+RECEIVING_NEEDLES = ('cushion', 'separation', 'air_yards', 'yac', 'expected', 'catch', 'target')
+ID_NEEDLES = ('player_id', 'gsis', 'player_name', 'player_display')
+
 mod = import_library()
 print(f"Using library: {mod.__name__}\n")
 
@@ -9,7 +11,7 @@ print(f"Using library: {mod.__name__}\n")
 print("Testing NextGen Stats - Receiving")
 print("=" * 60)
 try:
-    df, func_name = call_dataset(mod, "nextgen_stats", seasons=[2024], stat_type="receiving")
+    df, func_name = call_dataset(mod, "nextgen_stats", seasons=[2024], stat_type="receiving", backend="polars")
     print(f"✅ Loaded {len(df):,} rows using {func_name}")
     print(f"Shape: {df.shape[0]:,} rows × {df.shape[1]} columns\n")
     
@@ -20,26 +22,26 @@ try:
     
     print(f"\n\nSAMPLE DATA (First 2 rows):")
     print("-" * 60)
-    pd.set_option('display.max_columns', None)
-    pd.set_option('display.width', 200)
-    print(df.head(2))
+    # One line per column, so wide frames are not truncated
+    df.head(2).glimpse()
+    
+    # Lower-case each column name once for both keyword scans
+    lowered = [(col, col.lower()) for col in df.columns]
     
     print(f"\n\nKEY METRICS FOR RECEIVING:")
     print("-" * 60)
-    receiving_metrics = [col for col in df.columns if any(x in col.lower() for x in 
-        ['cushion', 'separation', 'air_yards', 'yac', 'expected', 'catch', 'target'])]
+    receiving_metrics = [col for col, lc in lowered if any(x in lc for x in RECEIVING_NEEDLES)]
     for col in receiving_metrics:
         print(f"  - {col}")
     
     # Check player matching
     print(f"\n\nPLAYER IDENTIFIERS:")
     print("-" * 60)
-    id_cols = [col for col in df.columns if any(x in col.lower() for x in 
-        ['player_id', 'gsis', 'player_name', 'player_display'])]
+    id_cols = [col for col, lc in lowered if any(x in lc for x in ID_NEEDLES)]
     for col in id_cols:
         if col in df.columns:
-            print(f"  - {col}: {df[col].nunique():,} unique values")
-            print(f"    Sample: {df[col].iloc[0] if len(df) > 0 else 'N/A'}")
+            print(f"  - {col}: {df[col].drop_nulls().n_unique():,} unique values")
+            print(f"    Sample: {df[col][0] if len(df) > 0 else 'N/A'}")
     
 except Exception as e:
     print(f"❌ Error: {e}")
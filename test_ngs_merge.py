@@ -1,8 +1,13 @@
 """
 Test script to diagnose NextGen Stats merge issue
 """
-import requests
-import json
+import asyncio
+
+import httpx
+
+from http_session import async_client
+
+BASE_URL = 'http://127.0.0.1:8000'
 
 print("=" * 80)
 print("Testing NextGen Stats API Integration")
@@ -11,7 +16,7 @@ print("=" * 80)
 # Test 1: Check if server is running
 print("\n1. Checking server health...")
 try:
-    r = requests.get('http://127.0.0.1:8000/health', timeout=5)
+    r = httpx.get(f'{BASE_URL}/health', timeout=5)
     print(f"   ✅ Server is running: {r.status_code}")
     print(f"   Response: {r.json()}")
 except Exception as e:
@@ -19,11 +24,32 @@ except Exception as e:
     print("   Please make sure the server is running: uvicorn api:app --reload")
     exit(1)
 
+# Tests 2-4 are independent; request them concurrently and report in order
+REQUESTS = [
+    ('/v1/data/player_stats?seasons=2024&limit=1', 30),
+    ('/v1/data/player_stats?seasons=2024&include_ngs=true&ngs_stat_type=receiving&limit=1', 60),
+    ('/v1/data/player_stats?seasons=2025&include_ngs=true&ngs_stat_type=receiving&limit=1', 60),
+]
+
+async def fetch_all():
+    async with async_client(base_url=BASE_URL) as client:
+        return await asyncio.gather(
+            *(client.get(path, timeout=timeout) for path, timeout in REQUESTS),
+            return_exceptions=True,
+        )
+
+def response_json(r):
+    """Re-raise a failed request inside the caller's try block"""
+    if isinstance(r, BaseException):
+        raise r
+    return r.json()
+
+responses = asyncio.run(fetch_all())
+
 # Test 2: Request player stats WITHOUT NextGen Stats
 print("\n2. Testing player_stats WITHOUT NextGen Stats (2024)...")
 try:
-    r = requests.get('http://127.0.0.1:8000/v1/data/player_stats?seasons=2024&limit=1', timeout=30)
-    data = r.json()
+    data = response_json(responses[0])
     if data.get('data') and len(data['data']) > 0:
         player = data['data'][0]
         print(f"   ✅ Got {len(data['data'])} players")
@@ -38,8 +64,7 @@ except Exception as e:
 # Test 3: Request player stats WITH NextGen Stats (2024)
 print("\n3. Testing player_stats WITH NextGen Stats (2024)...")
 try:
-    r = requests.get('http://127.0.0.1:8000/v1/data/player_stats?seasons=2024&include_ngs=true&ngs_stat_type=receiving&limit=1', timeout=60)
-    data = r.json()
+    data = response_json(responses[1])
     if data.get('data') and len(data['data']) > 0:
         player = data['data'][0]
         print(f"   ✅ Got {len(data['data'])} players")
@@ -63,8 +88,7 @@ except Exception as e:
 # Test 4: Request player stats WITH NextGen Stats (2025)
 print("\n4. Testing player_stats WITH NextGen Stats (2025)...")
 try:
-    r = requests.get('http://127.0.0.1:8000/v1/data/player_stats?seasons=2025&include_ngs=true&ngs_stat_type=receiving&limit=1', timeout=60)
-    data = r.json()
+    data = response_json(responses[2])
     if data.get('data') and len(data['data']) > 0:
         player = data['data'][0]
         print(f"   ✅ Got {len(data['data'])} players")
@@ -1,48 +1,58 @@
 import nflreadpy
 import pandas as pd
+import polars as pl
+from nflread_adapter import call_dataset_lazy
 
-print("Testing route estimation from PBP receiver data for 2025...\n")
+PBP_COLUMNS = ['play_type', 'receiver_player_id', 'receiver_player_name', 'season', 'week']
 
-# Load 2025 PBP and convert to pandas
-pbp_raw = nflreadpy.load_pbp(seasons=[2025])
-pbp = pbp_raw.to_pandas() if hasattr(pbp_raw, 'to_pandas') else pbp_raw
+print("Testing route estimation from PBP receiver data for 2025...\n")
 
-# Filter to pass plays
-pass_plays = pbp[pbp['play_type'] == 'pass'].copy()
-print(f"Pass plays in 2025: {len(pass_plays)}")
+# Scan 2025 PBP lazily: only pass plays and the columns used below are read
+pass_plays = call_dataset_lazy(
+    nflreadpy, 'pbp', [2025], columns=PBP_COLUMNS, filters=pl.col('play_type') == 'pass'
+)
+print(f"Pass plays in 2025: {pass_plays.height}")
 
 # Approach 1: Count targeted receivers per player/week
 print("\n=== Approach 1: Targeted Receiver Routes ===")
 print("Count each pass play where player was the target as a route")
 
-targeted_routes = pass_plays[pass_plays['receiver_player_id'].notna()].copy()
-targeted_routes = targeted_routes.groupby(['receiver_player_id', 'season', 'week']).size().reset_index(name='targeted_routes')
+# receiver_player_name rides along as a group key (one name per id), so the
+# name lookup below needs no second pass over PBP and no merge
+targeted_routes = (
+    pass_plays.lazy()
+    .filter(pl.col('receiver_player_id').is_not_null())
+    .group_by(['receiver_player_id', 'receiver_player_name', 'season', 'week'])
+    .agg(pl.len().alias('targeted_routes'))
+    .collect()
+)
 
-print(f"Unique receivers with targets in 2025: {targeted_routes['receiver_player_id'].nunique()}")
+print(f"Unique receivers with targets in 2025: {targeted_routes['receiver_player_id'].n_unique()}")
 print(f"\nTop 5 by targeted routes:")
-top_receivers = targeted_routes.groupby('receiver_player_id')['targeted_routes'].sum().sort_values(ascending=False).head()
-for player_id, routes in top_receivers.items():
+top_receivers = (
+    targeted_routes.group_by('receiver_player_id')
+    .agg(pl.col('targeted_routes').sum())
+    .sort('targeted_routes', descending=True)
+    .head()
+)
+for player_id, routes in top_receivers.iter_rows():
     print(f"  {player_id}: {routes} routes")
 
 # Check if we can join to player names
 print("\n=== Trying to get player names ===")
-# Get unique receiver IDs and names from PBP
-receiver_info = pbp[pbp['receiver_player_id'].notna()][['receiver_player_id', 'receiver_player_name']].drop_duplicates()
-print(f"Found {len(receiver_info)} unique receivers")
+receiver_info = targeted_routes.select(['receiver_player_id', 'receiver_player_name']).unique()
+print(f"Found {receiver_info.height} unique receivers")
 
-if len(receiver_info) > 0:
-    # Merge names
-    targeted_routes = targeted_routes.merge(
-        receiver_info,
-        left_on='receiver_player_id',
-        right_on='receiver_player_id',
-        how='left'
-    )
-    
+if receiver_info.height > 0:
     # Show top receivers with names
     print(f"\nTop 10 WRs by total targeted routes (with names):")
-    top_by_name = targeted_routes.groupby(['receiver_player_id', 'receiver_player_name'])['targeted_routes'].sum().sort_values(ascending=False).head(10)
-    for (pid, name), routes in top_by_name.items():
+    top_by_name = (
+        targeted_routes.group_by(['receiver_player_id', 'receiver_player_name'])
+        .agg(pl.col('targeted_routes').sum())
+        .sort('targeted_routes', descending=True)
+        .head(10)
+    )
+    for pid, name, routes in top_by_name.iter_rows():
         print(f"  {name}: {routes} routes")
 
 # Compare to players in player_stats
@@ -1,6 +1,6 @@
-import requests
+from http_session import SESSION
 
-r = requests.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2024&limit=100')
+r = SESSION.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2024&limit=100')
 data = r.json()
 
 wr_data = [p for p in data['data'] if p.get('position') == 'WR'][:5]
@@ -1,8 +1,8 @@
-import requests
+from http_session import SESSION
 
 print("Testing 2025 ESTIMATED routes...\n")
 
-r = requests.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2025&limit=100')
+r = SESSION.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2025&limit=100')
 data = r.json()
 wr_data = [p for p in data['data'] if p.get('position') == 'WR'][:10]
 
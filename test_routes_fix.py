@@ -1,10 +1,20 @@
-import requests
+import asyncio
+
+from http_session import async_client
 
 print("Testing 2025 routes after fix...\n")
 
+async def fetch_seasons(*seasons):
+    async with async_client(base_url='http://localhost:8000', timeout=None) as client:
+        return await asyncio.gather(
+            *(client.get('/v1/data/player_stats', params={'seasons_csv': s, 'limit': 100}) for s in seasons)
+        )
+
+# Both seasons are requested concurrently
+r, r2 = asyncio.run(fetch_seasons(2025, 2024))
+
 # Test with 2025
 print("1. Testing 2025 season:")
-r = requests.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2025&limit=100')
 data = r.json()
 wr_data = [p for p in data['data'] if p.get('position') == 'WR'][:5]
 
@@ -15,7 +25,6 @@ for p in wr_data:
     print(f"   {name}: routes={routes}, targets={targets}")
 
 print("\n2. Testing 2024 season (should have routes):")
-r2 = requests.get('http://localhost:8000/v1/data/player_stats?seasons_csv=2024&limit=100')
 data2 = r2.json()
 wr_data2 = [p for p in data2['data'] if p.get('position') == 'WR'][:5]
 
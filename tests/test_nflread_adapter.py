@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from nflread_adapter import downcast_numeric
+
+
+def test_downcast_numeric_pandas_uses_int32_and_keeps_values():
+    df = pd.DataFrame({"week": [1, 18], "yards": [120, 5], "big": [0, 2**40], "pts": [12.5, 0.0]})
+    out = downcast_numeric(df)
+    assert out["week"].dtype == np.int32
+    assert out["yards"].dtype == np.int32
+    assert out["big"].dtype == np.int64  # outside int32 range: left as-is
+    assert out["pts"].dtype == np.float32
+    pd.testing.assert_frame_equal(out.astype(df.dtypes.to_dict()), df)
+
+
+def test_downcast_numeric_matches_polars_dtypes():
+    data = {"week": [1, 18], "pts": [12.5, 0.0]}
+    pd_out = downcast_numeric(pd.DataFrame(data))
+    pl_out = downcast_numeric(pl.DataFrame(data))
+    assert pl_out.schema["week"] == pl.Int32
+    assert pl_out.schema["pts"] == pl.Float32
+    assert pl_out.to_pandas().dtypes.to_dict() == pd_out.dtypes.to_dict()
@@ -0,0 +1,56 @@
+import importlib.util
+import threading
+from pathlib import Path
+
+import pytest
+
+# utils.py shadows the utils/ package, so load the module by path (as api.py does)
+_spec = importlib.util.spec_from_file_location(
+    "performance", Path(__file__).parents[1] / "utils" / "performance.py"
+)
+performance = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(performance)
+
+
+def test_metrics_ring_wraps_around():
+    ring = performance.MetricsRing(4)
+    for d in range(10):
+        ring.append(float(d))
+    assert len(ring) == 4
+    assert sorted(ring.durations()) == [6.0, 7.0, 8.0, 9.0]
+    ring.clear()
+    assert len(ring) == 0
+
+
+def test_metrics_ring_concurrent_appends_are_not_lost():
+    ring = performance.MetricsRing(100_000)
+
+    def worker():
+        for _ in range(5_000):
+            ring.append(1.0)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert ring.idx == 40_000
+
+
+def test_rank_stats_nearest_rank_percentiles():
+    values = [float(v) for v in range(100, 0, -1)]  # 100..1, unsorted input
+    stats = performance._rank_stats(values, (0.5, 0.95, 0.99))
+    ordered = sorted(values)
+    assert stats[0.5] == ordered[50]
+    assert stats[0.95] == ordered[95]
+    assert stats[0.99] == ordered[99]
+    assert (stats["min"], stats["max"], stats["avg"]) == (1.0, 100.0, pytest.approx(50.5))
+
+
+def test_iso_ts_reuses_string_within_a_second(monkeypatch):
+    monkeypatch.setattr(performance.time, "time", lambda: 1_700_000_000.2)
+    first = performance._iso_ts()
+    monkeypatch.setattr(performance.time, "time", lambda: 1_700_000_000.9)
+    assert performance._iso_ts() is first
+    monkeypatch.setattr(performance.time, "time", lambda: 1_700_000_001.0)
+    assert performance._iso_ts() != first
@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+from sqlalchemy import Numeric, create_engine, text
+from sqlalchemy.orm import Session
+
+from database import queries
+
+
+def test_fetch_dataframe_merges_decimal_chunks(monkeypatch):
+    # Each chunk infers its own decimal precision/scale; 2 rows per chunk
+    monkeypatch.setattr(queries, "STREAM_YIELD_PER", 2)
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER, amount NUMERIC, note TEXT)"))
+        conn.execute(
+            text("INSERT INTO t VALUES (:id, :amount, :note)"),
+            [
+                {"id": 1, "amount": "1.5", "note": None},
+                {"id": 2, "amount": "2.5", "note": None},
+                {"id": 3, "amount": "123.45", "note": "x"},
+                {"id": 4, "amount": "0.01", "note": None},
+                {"id": 5, "amount": "9999.9", "note": "y"},
+            ],
+        )
+
+    query = text("SELECT id, amount, note FROM t ORDER BY id").columns(amount=Numeric(asdecimal=True))
+    with Session(engine) as db:
+        df = queries._fetch_dataframe(db, query, {})
+
+    assert df["id"].tolist() == [1, 2, 3, 4, 5]
+    assert df["amount"].tolist() == [
+        Decimal("1.5"), Decimal("2.5"), Decimal("123.45"), Decimal("0.01"), Decimal("9999.9")
+    ]
+    assert df["note"].tolist() == [None, None, "x", None, "y"]
@@ -0,0 +1,42 @@
+import polars as pl
+
+from nflread_adapter import encode_categoricals
+from route_estimation import count_actual_routes, estimate_routes, team_game_pass_rates
+
+
+def _pbp() -> pl.DataFrame:
+    return encode_categoricals(pl.DataFrame({
+        "game_id": ["g1", "g1", "g1", "g1"],
+        "play_id": [1, 2, 3, 4],
+        "play_type": ["pass", "pass", "run", "punt"],
+        "week": [1, 1, 1, 1],
+        "season": [2024, 2024, 2024, 2024],
+        "posteam": ["KC", "KC", "KC", "KC"],
+    }))
+
+
+def test_count_actual_routes_explodes_offense_players():
+    participation = pl.DataFrame({
+        "nflverse_game_id": ["g1", "g1", "g1"],
+        "play_id": [1, 2, 3],
+        "offense_players": ["a;b", "a", "a;b"],
+    })
+    routes = count_actual_routes(_pbp(), participation)
+    assert dict(zip(routes["player_id"], routes["actual_routes"])) == {"a": 2, "b": 1}
+
+
+def test_pass_rates_and_estimated_routes():
+    game_stats = team_game_pass_rates(_pbp())
+    assert game_stats[["pass_plays", "total_plays"]].iloc[0].tolist() == [2, 3]
+
+    snaps = encode_categoricals(pl.DataFrame({
+        "season": [2024, 2024],
+        "week": [1, 1],
+        "team": ["KC", "KC"],
+        "player": ["A", "B"],
+        "position": ["WR", "QB"],
+        "offense_snaps": [30.0, 30.0],
+    }))
+    estimated = estimate_routes(snaps, game_stats)
+    assert estimated["player"].tolist() == ["A"]
+    assert estimated["estimated_routes"].tolist() == [20.0]
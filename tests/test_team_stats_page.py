@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import polars as pl
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import nflread_adapter
+
+PAGE = str(Path(__file__).parents[1] / "pages" / "4_Team_Stats.py")
+
+
+def _fake_call_dataset_lazy(module, dataset, seasons, columns=None, filters=None, transform=None):
+    lf = pl.LazyFrame({
+        "recent_team": ["KC", "KC", "BUF", None],
+        "week": [1, 2, 1, 1],
+        "passing_yards": [300.0, 250.0, 200.0, 10.0],
+        "rushing_yards": [100.0, 50.0, 150.0, 10.0],
+        "passing_tds": [3, 2, 1, 0],
+        "rushing_tds": [1, 0, 2, 0],
+        "fantasy_points": [20.0, 15.0, 18.0, 1.0],
+    })
+    if columns:
+        lf = lf.select(columns)
+    if filters is not None:
+        lf = lf.filter(filters)
+    if transform is not None:
+        lf = transform(lf)
+    return lf.collect()
+
+
+def test_team_stats_page_survives_unwritable_cache_dir(tmp_path, monkeypatch):
+    # A regular file as the cache dir: mkdir/write_ipc raise OSError
+    not_a_dir = tmp_path / "cache"
+    not_a_dir.write_text("")
+    monkeypatch.setattr(nflread_adapter, "DATASET_CACHE_DIR", not_a_dir)
+    monkeypatch.setattr(nflread_adapter, "call_dataset_lazy", _fake_call_dataset_lazy)
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+    at = AppTest.from_file(PAGE, default_timeout=60)
+    at.run()
+
+    assert not at.exception
+    team_stats = at.dataframe[0].value.set_index("recent_team")
+    assert team_stats.loc["KC", "total_yards"] == 700.0
+    assert team_stats.loc["BUF", "total_tds"] == 3
+
+
+def test_team_stats_page_removes_partial_ipc_file(tmp_path, monkeypatch):
+    def failing_write_ipc(self, file, *args, **kwargs):
+        Path(file).write_bytes(b"partial")
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(nflread_adapter, "DATASET_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(nflread_adapter, "call_dataset_lazy", _fake_call_dataset_lazy)
+    monkeypatch.setattr(pl.DataFrame, "write_ipc", failing_write_ipc)
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+    at = AppTest.from_file(PAGE, default_timeout=60)
+    at.run()
+
+    assert not at.exception
+    assert list(tmp_path.iterdir()) == []
@@ -1,12 +1,17 @@
 import datetime as dt
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import polars as pl
 import streamlit as st
 
 from nflread_adapter import (
-    call_dataset,
+    call_dataset_cached,
+    call_dataset_lazy,
+    downcast_numeric,
+    encode_categoricals,
     import_library,
 )
 
@@ -17,106 +22,261 @@ def get_library_module(preferred: Optional[str] = None):
 
 @st.cache_data(show_spinner=False)
 def load_dataset_cached(
-    module_name: str, dataset: str, seasons: List[int]
-) -> pd.DataFrame:
+    module_name: str,
+    dataset: str,
+    seasons: List[int],
+    backend: str = "pandas",
+    categorical: bool = False,
+    downcast: bool = False,
+    columns: Optional[List[str]] = None,
+):
+    """Dataset load cached in-process here and on disk by call_dataset_cached.
+
+    A new Streamlit process reads the local ZSTD parquet copy under
+    NFL_DATAMANS_CACHE_DIR instead of downloading the dataset again.
+    """
+    module = get_library_module(module_name if module_name else None)
+    df, _ = call_dataset_cached(module, dataset, seasons=seasons, backend=backend, columns=columns)
+    if categorical:
+        df = encode_categoricals(df)
+    if downcast:
+        df = downcast_numeric(df)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def load_players_index_cached(module_name: str, seasons: List[int]) -> pl.DataFrame:
+    """Distinct (player_id, player_display_name) pairs from player_stats, sorted by name."""
+    df = load_dataset_lazy_cached(module_name, "player_stats", seasons, columns=["player_id", "player_display_name"])
+    return (
+        df.drop_nulls()
+        .unique()
+        .sort("player_display_name", "player_id")
+    )
+
+
+@st.cache_data(show_spinner=False)
+def load_dataset_lazy_cached(
+    module_name: str,
+    dataset: str,
+    seasons: List[int],
+    columns: Optional[List[str]] = None,
+    week_range: Optional[Tuple[int, int]] = None,
+    categorical: bool = False,
+    downcast: bool = False,
+) -> pl.DataFrame:
+    """Polars scan of a dataset with the column list and week range pushed down.
+
+    Only the listed columns' chunks are fetched from the remote parquet files.
+    """
     module = get_library_module(module_name if module_name else None)
-    df, _ = call_dataset(module, dataset, seasons=seasons)
+    filters = pl.col("week").is_between(*week_range) if week_range else None
+    df = call_dataset_lazy(module, dataset, seasons, columns=columns, filters=filters)
+    if categorical:
+        df = encode_categoricals(df)
+    if downcast:
+        df = downcast_numeric(df)
     return df
 
-def _first_present(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
-    lower_map = {c.lower(): c for c in df.columns}
+
+@lru_cache(maxsize=256)
+def _lower_map_for(columns: Tuple[str, ...]) -> Dict[str, str]:
+    return {c.lower(): c for c in columns}
+
+
+def _lower_map(df) -> Dict[str, str]:
+    """Lower-cased column name -> column name, for case-insensitive lookups.
+
+    Memoized on the column names, so reruns over the same schema reuse one
+    (read-only) mapping.
+    """
+    return _lower_map_for(tuple(df.columns))
+
+
+def _first_present(
+    df: pd.DataFrame, candidates: list[str], lower_map: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    # Pass lower_map from _lower_map when looking up several names in one frame
+    if lower_map is None:
+        lower_map = _lower_map(df)
     for nm in candidates:
         c = lower_map.get(nm.lower())
         if c is not None:
             return c
     return None
 
+
+# (column aliases, points per unit); receptions are weighted by the ppr argument
+FANTASY_SCORING = [
+    (("passing_yards", "pass_yards", "pass_yds"), 0.04),
+    (("passing_tds", "pass_tds"), 4),
+    (("interceptions", "pass_int", "ints"), -2),
+    (("rushing_yards", "rush_yards", "rush_yds"), 0.1),
+    (("rushing_tds", "rush_tds"), 6),
+    (("receiving_yards", "rec_yards"), 0.1),
+    (("receiving_tds", "rec_tds"), 6),
+    (("receptions", "rec", "targets_caught"), None),
+    (("fumbles_lost", "fum_lost"), -2),
+    (("two_pt_conversions", "two_point_conversions", "two_pt", "two_point"), 2),
+]
+
+
+# Every column _fantasy_points_expr / _shares_and_adv_metrics_exprs may read,
+# for loading with a column projection
+FANTASY_INPUT_COLUMNS = ["fantasy_points_ppr", "ppr", "fantasy_points"] + [
+    name for names, _ in FANTASY_SCORING for name in names
+]
+SHARE_INPUT_COLUMNS = [
+    "target_share", "air_yards_share", "racr", "pacr", "wopr",
+    "air_yards", "airyards", "team_air_yards", "targets", "team_targets",
+    "receiving_yards", "rec_yards", "passing_yards", "pass_yards",
+    "pass_air_yards", "air_yards_thrown",
+]
+
+
 def _compute_fantasy_points(df: pd.DataFrame, ppr: float = 1.0) -> pd.Series:
     # Prefer built-in if available
     for c in ["fantasy_points_ppr", "ppr", "fantasy_points"]:
         if c in df.columns:
-            # If it's fantasy_points (unknown scoring), still return it
-            return pd.to_numeric(df[c], errors="coerce")
+            # If it's fantasy_points (unknown scoring), still return it; numeric
+            # columns are returned as-is, only other dtypes are coerced
+            s = df[c]
+            return s if pd.api.types.is_numeric_dtype(s) else pd.to_numeric(s, errors="coerce")
+
+    # Derive from available stats (standard ESPN-ish scoring); missing inputs
+    # are treated as 0. The first present alias of each stat becomes one row of
+    # a (stats x players) float64 matrix, scored with a single weights @ matrix.
+    present = []
+    for names, weight in FANTASY_SCORING:
+        c = next((n for n in names if n in df.columns), None)
+        if c is not None:
+            present.append((c, ppr if weight is None else weight))
+    stats = np.empty((len(present), len(df)), dtype=np.float64)
+    for row, (c, _) in zip(stats, present):
+        row[:] = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float64, na_value=0.0)
+    weights = np.array([w for _, w in present], dtype=np.float64)
+    return pd.Series(weights @ stats, index=df.index)
 
-    # Derive from available stats; missing inputs are treated as 0
-    def col(*names: str) -> pd.Series:
-        for n in names:
-            if n in df.columns:
-                return pd.to_numeric(df[n], errors="coerce").fillna(0)
-        return pd.Series(0, index=df.index)
-
-    pass_yd = col("passing_yards", "pass_yards", "pass_yds")
-    pass_td = col("passing_tds", "pass_tds")
-    interceptions = col("interceptions", "pass_int", "ints")
-    rush_yd = col("rushing_yards", "rush_yards", "rush_yds")
-    rush_td = col("rushing_tds", "rush_tds")
-    rec_yd = col("receiving_yards", "rec_yards")
-    rec_td = col("receiving_tds", "rec_tds")
-    receptions = col("receptions", "rec", "targets_caught")
-    fum_lost = col("fumbles_lost", "fum_lost")
-    two_pt = col("two_pt_conversions", "two_point_conversions", "two_pt", "two_point")
-
-    # Standard ESPN-ish scoring baseline
-    pts = (
-        pass_yd * 0.04
-        + pass_td * 4
-        - interceptions * 2
-        + rush_yd * 0.1
-        + rush_td * 6
-        + rec_yd * 0.1
-        + rec_td * 6
-        + receptions * ppr
-        - fum_lost * 2
-        + two_pt * 2
-    )
-    return pts
+
+def _divide_nonzero(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """num / den as float64, NaN where den is 0 or missing."""
+    out = np.full_like(num, np.nan)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
 
 
 def _compute_shares_and_adv_metrics(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
+    # Shallow copy: derived columns are added without copying the input's data
+    # (assign() would still deep-copy every block without copy-on-write)
+    out = df.copy(deep=False)
     # Aliases
-    ay_col = _first_present(out, ["air_yards", "airyards"])  # player air yards
-    team_ay_col = _first_present(out, ["team_air_yards"])  # team air yards
-    targets_col = _first_present(out, ["targets"])  # player targets
-    team_tgt_col = _first_present(out, ["team_targets"])  # team targets
-    rec_yards_col = _first_present(out, ["receiving_yards", "rec_yards"])  # receiving yards
-    pass_yards_col = _first_present(out, ["passing_yards", "pass_yards"])  # QB passing yards
-    qb_ay_col = _first_present(out, ["pass_air_yards", "air_yards_thrown"])  # QB air yards thrown
+    lower = _lower_map(out)
+    ay_col = _first_present(out, ["air_yards", "airyards"], lower)  # player air yards
+    team_ay_col = _first_present(out, ["team_air_yards"], lower)  # team air yards
+    targets_col = _first_present(out, ["targets"], lower)  # player targets
+    team_tgt_col = _first_present(out, ["team_targets"], lower)  # team targets
+    rec_yards_col = _first_present(out, ["receiving_yards", "rec_yards"], lower)  # receiving yards
+    pass_yards_col = _first_present(out, ["passing_yards", "pass_yards"], lower)  # QB passing yards
+    qb_ay_col = _first_present(out, ["pass_air_yards", "air_yards_thrown"], lower)  # QB air yards thrown
+
+    # Each column is coerced to float64 once and shared across the metrics below
+    numeric: Dict[str, np.ndarray] = {}
+
+    def values(c: str) -> np.ndarray:
+        if c not in numeric:
+            numeric[c] = pd.to_numeric(out[c], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        return numeric[c]
 
     # target_share
     if "target_share" not in out.columns and targets_col and team_tgt_col:
-        with np.errstate(divide="ignore", invalid="ignore"):
-            out["target_share"] = pd.to_numeric(out[targets_col], errors="coerce") / pd.to_numeric(
-                out[team_tgt_col], errors="coerce"
-            )
+        numeric["target_share"] = _divide_nonzero(values(targets_col), values(team_tgt_col))
+        out["target_share"] = numeric["target_share"]
 
     # air_yards_share
     if "air_yards_share" not in out.columns and ay_col and team_ay_col:
-        with np.errstate(divide="ignore", invalid="ignore"):
-            out["air_yards_share"] = pd.to_numeric(out[ay_col], errors="coerce") / pd.to_numeric(
-                out[team_ay_col], errors="coerce"
-            )
+        numeric["air_yards_share"] = _divide_nonzero(values(ay_col), values(team_ay_col))
+        out["air_yards_share"] = numeric["air_yards_share"]
 
     # racr (receiver)
     if "racr" not in out.columns and rec_yards_col and ay_col:
-        ay = pd.to_numeric(out[ay_col], errors="coerce")
-        with np.errstate(divide="ignore", invalid="ignore"):
-            out["racr"] = pd.to_numeric(out[rec_yards_col], errors="coerce") / ay.replace(0, np.nan)
+        out["racr"] = _divide_nonzero(values(rec_yards_col), values(ay_col))
 
     # pacr (passer)
     if "pacr" not in out.columns and pass_yards_col and qb_ay_col:
-        qb_ay = pd.to_numeric(out[qb_ay_col], errors="coerce")
-        with np.errstate(divide="ignore", invalid="ignore"):
-            out["pacr"] = pd.to_numeric(out[pass_yards_col], errors="coerce") / qb_ay.replace(0, np.nan)
+        out["pacr"] = _divide_nonzero(values(pass_yards_col), values(qb_ay_col))
 
     # wopr
     if "wopr" not in out.columns and {"target_share", "air_yards_share"}.issubset(out.columns):
-        ts = pd.to_numeric(out.get("target_share"), errors="coerce")
-        ays = pd.to_numeric(out.get("air_yards_share"), errors="coerce")
-        out["wopr"] = 1.5 * ts + 0.7 * ays
+        out["wopr"] = 1.5 * values("target_share") + 0.7 * values("air_yards_share")
 
     return out
 
+def _fantasy_points_expr(columns: List[str], ppr: float = 1.0) -> pl.Expr:
+    """Polars expression equivalent of _compute_fantasy_points for a frame with ``columns``."""
+    for c in ["fantasy_points_ppr", "ppr", "fantasy_points"]:
+        if c in columns:
+            return pl.col(c).cast(pl.Float64, strict=False)
+
+    def col(*names: str) -> pl.Expr:
+        for n in names:
+            if n in columns:
+                return pl.col(n).cast(pl.Float64, strict=False).fill_null(0)
+        return pl.lit(0.0)
+
+    return (
+        col("passing_yards", "pass_yards", "pass_yds") * 0.04
+        + col("passing_tds", "pass_tds") * 4
+        - col("interceptions", "pass_int", "ints") * 2
+        + col("rushing_yards", "rush_yards", "rush_yds") * 0.1
+        + col("rushing_tds", "rush_tds") * 6
+        + col("receiving_yards", "rec_yards") * 0.1
+        + col("receiving_tds", "rec_tds") * 6
+        + col("receptions", "rec", "targets_caught") * ppr
+        - col("fumbles_lost", "fum_lost") * 2
+        + col("two_pt_conversions", "two_point_conversions", "two_pt", "two_point") * 2
+    )
+
+
+def _shares_and_adv_metrics_exprs(df: pl.DataFrame) -> List[List[pl.Expr]]:
+    """Polars version of _compute_shares_and_adv_metrics.
+
+    Returns stages for successive ``with_columns`` calls; wopr is derived from
+    the shares computed in the first stage.
+    """
+
+    def num(c: str) -> pl.Expr:
+        return pl.col(c).cast(pl.Float64, strict=False)
+
+    def nonzero(c: str) -> pl.Expr:
+        return pl.when(num(c) != 0).then(num(c))
+
+    lower = _lower_map(df)
+    ay_col = _first_present(df, ["air_yards", "airyards"], lower)
+    team_ay_col = _first_present(df, ["team_air_yards"], lower)
+    targets_col = _first_present(df, ["targets"], lower)
+    team_tgt_col = _first_present(df, ["team_targets"], lower)
+    rec_yards_col = _first_present(df, ["receiving_yards", "rec_yards"], lower)
+    pass_yards_col = _first_present(df, ["passing_yards", "pass_yards"], lower)
+    qb_ay_col = _first_present(df, ["pass_air_yards", "air_yards_thrown"], lower)
+
+    stage: List[pl.Expr] = []
+    if "target_share" not in df.columns and targets_col and team_tgt_col:
+        stage.append((num(targets_col) / nonzero(team_tgt_col)).alias("target_share"))
+    if "air_yards_share" not in df.columns and ay_col and team_ay_col:
+        stage.append((num(ay_col) / nonzero(team_ay_col)).alias("air_yards_share"))
+    if "racr" not in df.columns and rec_yards_col and ay_col:
+        stage.append((num(rec_yards_col) / nonzero(ay_col)).alias("racr"))
+    if "pacr" not in df.columns and pass_yards_col and qb_ay_col:
+        stage.append((num(pass_yards_col) / nonzero(qb_ay_col)).alias("pacr"))
+
+    present = set(df.columns) | {e.meta.output_name() for e in stage}
+    wopr: List[pl.Expr] = []
+    if "wopr" not in df.columns and {"target_share", "air_yards_share"}.issubset(present):
+        wopr.append((1.5 * num("target_share") + 0.7 * num("air_yards_share")).alias("wopr"))
+
+    return [exprs for exprs in (stage, wopr) if exprs]
+
+
 def _present_filters(df: pd.DataFrame) -> pd.DataFrame:
     # Generic team-like filters
     team_like = [
@@ -130,7 +290,7 @@ def _present_filters(df: pd.DataFrame) -> pd.DataFrame:
     ]
     week_like = ["week"]
 
-    lower_cols = {c.lower(): c for c in df.columns}
+    lower_cols = _lower_map(df)
     present_team_cols = [lower_cols[c] for c in lower_cols.keys() if c in team_like]
     present_week_cols = [lower_cols[c] for c in lower_cols.keys() if c in week_like]
 
@@ -138,14 +298,16 @@ def _present_filters(df: pd.DataFrame) -> pd.DataFrame:
         filtered = df
         if present_team_cols:
             team_col = st.selectbox("Team column", options=present_team_cols)
-            teams = sorted([str(x) for x in filtered[team_col].dropna().unique()])
+            # Categories are already distinct and non-null; only those go through str()/sorted
+            teams = sorted(filtered[team_col].astype("category").cat.categories.astype(str).tolist())
             selected = st.multiselect("Teams", options=teams)
             if selected:
                 filtered = filtered[filtered[team_col].astype(str).isin(selected)]
 
         if present_week_cols:
             week_col = present_week_cols[0]
-            weeks = sorted([int(x) for x in pd.to_numeric(filtered[week_col], errors="coerce").dropna().unique()])
+            week_values = pd.to_numeric(filtered[week_col], errors="coerce").dropna()
+            weeks = sorted(int(x) for x in pd.unique(week_values))
             selected_w = st.multiselect("Weeks", options=weeks)
             if selected_w:
                 filtered = filtered[filtered[week_col].isin(selected_w)]
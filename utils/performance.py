@@ -7,14 +7,66 @@ Tracks request timing, identifies bottlenecks, and logs slow operations.
 import time
 import functools
 import logging
-from typing import Callable, Any, Dict, Optional
+import threading
+from typing import Callable, Any, Dict, Optional, Tuple
 from collections import defaultdict, deque
 from datetime import datetime
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# (unix second, its ISO string) for _iso_ts; replaced as one tuple so threads
+# never see a second paired with another second's string
+_last_iso_ts: Tuple[int, str] = (-1, "")
+
+
+def _iso_ts() -> str:
+    """Current time as an ISO string at second precision, reused within the second."""
+    global _last_iso_ts
+    sec = int(time.time())
+    last_sec, last_iso = _last_iso_ts
+    if sec == last_sec:
+        return last_iso
+    iso = datetime.fromtimestamp(sec).isoformat()
+    _last_iso_ts = (sec, iso)
+    return iso
+
+
+class MetricsRing:
+    """Fixed-size ring buffer of operation durations backed by a numpy array.
+    
+    Appends come from FastAPI's threadpool, so writes and snapshots share a lock.
+    """
+    
+    __slots__ = ("size", "idx", "dur", "_lock")
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.idx = 0  # Total samples written; the next slot is idx % size
+        self.dur = np.empty(size, dtype=np.float64)
+        self._lock = threading.Lock()
+    
+    def append(self, duration_ms: float):
+        with self._lock:
+            self.dur[self.idx % self.size] = duration_ms
+            self.idx += 1
+    
+    def __len__(self) -> int:
+        return min(self.idx, self.size)
+    
+    def durations(self) -> np.ndarray:
+        """Copy of the retained samples' durations (not in insertion order)."""
+        with self._lock:
+            return self.dur[:len(self)].copy()
+    
+    def clear(self):
+        with self._lock:
+            self.idx = 0
+
+
 # Store performance metrics
-PERFORMANCE_METRICS = deque(maxlen=1000)  # Last 1000 operations
+PERFORMANCE_METRICS = MetricsRing(1000)  # Last 1000 operations
 SLOW_OPERATIONS = deque(maxlen=100)  # Operations taking > 1 second
 ENDPOINT_TIMINGS = defaultdict(list)  # Timings by endpoint
 
@@ -25,20 +77,23 @@ class PerformanceTimer:
     def __init__(self, operation_name: str, threshold_ms: float = 1000.0):
         self.operation_name = operation_name
         self.threshold_ms = threshold_ms
-        self.start_time = None
-        self.end_time = None
+        self.threshold_ns = int(threshold_ms * 1_000_000)
+        self.start_ns = None
+        self.end_ns = None
         self.duration_ms = None
     
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.perf_counter()
-        self.duration_ms = (self.end_time - self.start_time) * 1000
+        self.end_ns = time.perf_counter_ns()
+        # Integer nanosecond delta; converted to ms once
+        elapsed_ns = self.end_ns - self.start_ns
+        self.duration_ms = elapsed_ns / 1_000_000.0
         
         # Log if slow
-        if self.duration_ms > self.threshold_ms:
+        if elapsed_ns > self.threshold_ns:
             logger.warning(
                 f"⏱️  SLOW OPERATION: {self.operation_name} took {self.duration_ms:.2f}ms "
                 f"(threshold: {self.threshold_ms}ms)"
@@ -46,15 +101,11 @@ class PerformanceTimer:
             SLOW_OPERATIONS.append({
                 "operation": self.operation_name,
                 "duration_ms": self.duration_ms,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_ts(),
             })
         
-        # Store metric
-        PERFORMANCE_METRICS.append({
-            "operation": self.operation_name,
-            "duration_ms": self.duration_ms,
-            "timestamp": datetime.now().isoformat(),
-        })
+        # Store metric (only durations feed the summary statistics)
+        PERFORMANCE_METRICS.append(self.duration_ms)
         
         return False
 
@@ -108,34 +159,51 @@ def track_endpoint_timing(endpoint_path: str):
     return decorator
 
 
+def _rank_stats(values, fractions) -> Dict[str, float]:
+    """avg/min/max plus nearest-rank percentiles (sorted(values)[int(n * f)])."""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return {"avg": 0, "min": 0, "max": 0, **{f: 0 for f in fractions}}
+    ranks = [int(arr.size * f) for f in fractions]
+    # One partition places every requested rank; no full sort
+    selected = np.partition(arr, ranks)
+    return {
+        "avg": float(arr.mean()),
+        "min": float(arr.min()),
+        "max": float(arr.max()),
+        **{f: float(selected[r]) for f, r in zip(fractions, ranks)},
+    }
+
+
 def get_performance_summary() -> Dict[str, Any]:
     """Get summary of performance metrics."""
     if not PERFORMANCE_METRICS:
         return {"message": "No metrics collected yet"}
     
     # Calculate statistics
-    durations = [m["duration_ms"] for m in PERFORMANCE_METRICS]
+    stats = _rank_stats(PERFORMANCE_METRICS.durations(), (0.5, 0.95, 0.99))
+    endpoint_stats = {}
+    for endpoint, timings in ENDPOINT_TIMINGS.items():
+        timing_stats = _rank_stats(timings, (0.95,))
+        endpoint_stats[endpoint] = {
+            "count": len(timings),
+            "avg_ms": timing_stats["avg"],
+            "min_ms": timing_stats["min"],
+            "max_ms": timing_stats["max"],
+            "p95_ms": timing_stats[0.95],
+        }
     
     return {
         "total_operations": len(PERFORMANCE_METRICS),
         "slow_operations": len(SLOW_OPERATIONS),
-        "avg_duration_ms": sum(durations) / len(durations) if durations else 0,
-        "min_duration_ms": min(durations) if durations else 0,
-        "max_duration_ms": max(durations) if durations else 0,
-        "p50_duration_ms": sorted(durations)[len(durations) // 2] if durations else 0,
-        "p95_duration_ms": sorted(durations)[int(len(durations) * 0.95)] if durations else 0,
-        "p99_duration_ms": sorted(durations)[int(len(durations) * 0.99)] if durations else 0,
+        "avg_duration_ms": stats["avg"],
+        "min_duration_ms": stats["min"],
+        "max_duration_ms": stats["max"],
+        "p50_duration_ms": stats[0.5],
+        "p95_duration_ms": stats[0.95],
+        "p99_duration_ms": stats[0.99],
         "recent_slow_operations": list(SLOW_OPERATIONS)[-10:],
-        "endpoint_stats": {
-            endpoint: {
-                "count": len(timings),
-                "avg_ms": sum(timings) / len(timings) if timings else 0,
-                "min_ms": min(timings) if timings else 0,
-                "max_ms": max(timings) if timings else 0,
-                "p95_ms": sorted(timings)[int(len(timings) * 0.95)] if timings else 0,
-            }
-            for endpoint, timings in ENDPOINT_TIMINGS.items()
-        }
+        "endpoint_stats": endpoint_stats,
     }
 
 
@@ -1,85 +1,39 @@
 import nflreadpy
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
+from nflread_adapter import call_dataset_lazy, encode_categoricals
+from route_estimation import (
+    ROUTE_PARTICIPATION_COLUMNS,
+    ROUTE_PBP_COLUMNS,
+    ROUTE_SNAP_COLUMNS,
+    count_actual_routes,
+    estimate_routes,
+    team_game_pass_rates,
+)
 
-print("Validating Route Estimation Logic (2024 Data)...\n")
-
-# 1. Load Data for 2024 (where we have both actual routes and snaps)
-print("Loading 2024 data...")
-pbp = nflreadpy.load_pbp(seasons=[2024])
-snaps = nflreadpy.load_snap_counts(seasons=[2024])
-participation = nflreadpy.load_participation(seasons=[2024])
-
-# Convert to pandas if needed
-pbp = pbp.to_pandas() if hasattr(pbp, 'to_pandas') else pbp
-snaps = snaps.to_pandas() if hasattr(snaps, 'to_pandas') else snaps
-participation = participation.to_pandas() if hasattr(participation, 'to_pandas') else participation
-
-print(f"Loaded: PBP({len(pbp)}), Snaps({len(snaps)}), Participation({len(participation)})")
-
-# 2. Calculate Actual Routes (Ground Truth)
-print("\nCalculating ACTUAL routes from Participation...")
-pbp_cols = ["game_id", "play_id", "play_type", "week", "season", "posteam"]
-pbp_lite = pbp[pbp_cols].copy()
-
-part_cols = ["nflverse_game_id", "play_id", "offense_players"]
-part_lite = participation[part_cols].copy()
-
-pass_plays = pbp_lite[pbp_lite['play_type'] == 'pass']
-merged = pd.merge(pass_plays, part_lite, left_on=['game_id', 'play_id'], right_on=['nflverse_game_id', 'play_id'])
+SEASONS = (2024,)  # Season with both actual routes (participation) and snaps
 
-merged['offense_players'] = merged['offense_players'].astype(str)
-merged['player_id_split'] = merged['offense_players'].str.split(';')
-exploded = merged.explode('player_id_split')
+print("Validating Route Estimation Logic (2024 Data)...\n")
 
-actual_routes = exploded.groupby(['player_id_split', 'season', 'week']).size().reset_index(name='actual_routes')
-actual_routes.rename(columns={'player_id_split': 'player_id'}, inplace=True)
+# 1-2. Calculate Actual Routes (Ground Truth)
+print("Calculating ACTUAL routes from Participation...")
+# Projected scans; pbp is loaded once for both actual routes and pass rates
+pbp = encode_categoricals(call_dataset_lazy(nflreadpy, "pbp", list(SEASONS), columns=ROUTE_PBP_COLUMNS))
+participation = call_dataset_lazy(nflreadpy, "participation", list(SEASONS), columns=ROUTE_PARTICIPATION_COLUMNS)
+actual_routes = count_actual_routes(pbp, participation)
 print(f"Calculated actual routes for {len(actual_routes)} player-weeks")
 
 # 3. Calculate Estimated Routes (Snaps * Pass Rate)
 print("\nCalculating ESTIMATED routes from Snaps * Pass Rate...")
-
-# A. Calculate Team Pass Rate per Game
-# Group by game_id and posteam
-game_stats = pbp_lite.groupby(['game_id', 'posteam']).agg(
-    pass_plays=('play_type', lambda x: (x == 'pass').sum()),
-    total_plays=('play_type', lambda x: x.isin(['pass', 'run']).sum())
-).reset_index()
-
-game_stats['pass_rate'] = game_stats['pass_plays'] / game_stats['total_plays']
-# Fill NaN or infinite rates (e.g. 0 plays)
-game_stats['pass_rate'] = game_stats['pass_rate'].fillna(0)
+game_stats = team_game_pass_rates(pbp)
 
 print("Sample Team Pass Rates:")
 print(game_stats[['posteam', 'pass_rate']].head())
 
-# B. Get Player Snaps
-# Snaps data has pfr_player_id, need to map to nflverse_id or use name?
-# Snaps has 'player' (name) and 'team'. 
-# Let's try to join on player name and team for this test, or use pfr_id map if available.
-# Ideally we'd map IDs, but for a quick test, let's use Name + Team + Week.
-
-# Filter snaps to offense only
-off_snaps = snaps[(snaps['offense_snaps'] > 0) & (snaps['position'].isin(['WR', 'TE', 'RB']))].copy()
-
-# Join Pass Rate to Snaps
-# Snaps has 'game_id' which is PFR game id, not nflverse game id.
-# But it has 'season', 'week', 'team'.
-# game_stats has 'game_id' (nflverse), 'posteam'. We need to join on season/week/team.
-# We need to add season/week to game_stats from pbp
-game_meta = pbp_lite[['game_id', 'season', 'week']].drop_duplicates()
-game_stats = game_stats.merge(game_meta, on='game_id')
-
-# Now join snaps to game_stats
-estimated = pd.merge(
-    off_snaps,
-    game_stats,
-    left_on=['season', 'week', 'team'],
-    right_on=['season', 'week', 'posteam'],
-    how='inner'
-)
-
-estimated['estimated_routes'] = (estimated['offense_snaps'] * estimated['pass_rate']).round(1)
+# Snaps are joined to pass rates by season/week/team (names bridge to player ids below)
+snaps = encode_categoricals(call_dataset_lazy(nflreadpy, "snap_counts", list(SEASONS), columns=ROUTE_SNAP_COLUMNS))
+estimated = estimate_routes(snaps, game_stats)
 
 # 4. Compare Actual vs Estimated
 print("\nComparing Actual vs Estimated...")
@@ -89,10 +43,19 @@ print("\nComparing Actual vs Estimated...")
 players_raw = nflreadpy.load_players()
 players = players_raw.to_pandas() if hasattr(players_raw, 'to_pandas') else players_raw
 
-players_map = players[['gsis_id', 'display_name', 'position']].copy()
-players_map.rename(columns={'gsis_id': 'player_id'}, inplace=True)
+players_map = players[['gsis_id', 'display_name', 'position']].set_index('gsis_id')
+players_map.index.name = 'player_id'
+
+# Many-to-one lookup against the indexed player table
+actual_with_name = actual_routes.join(players_map, on='player_id', how='inner')
 
-actual_with_name = pd.merge(actual_routes, players_map, on='player_id')
+# Share one category set between the two name keys so the merge hashes integer codes
+name_dtype = pd.CategoricalDtype(union_categoricals([
+    pd.Categorical(actual_with_name['display_name']),
+    pd.Categorical(estimated['player']),
+]).categories)
+actual_with_name['display_name'] = actual_with_name['display_name'].astype(name_dtype)
+estimated = estimated.astype({'player': name_dtype})
 
 # Join on Name + Week + Season (approximate but good enough for validation)
 comparison = pd.merge(
@@ -100,16 +63,24 @@ comparison = pd.merge(
     estimated,
     left_on=['display_name', 'week', 'season'],
     right_on=['player', 'week', 'season'],
-    how='inner'
+    how='inner',
+    sort=False,
+    copy=False
 )
 
 # Filter to WRs only for cleanest comparison
 wr_comp = comparison[comparison['position_x'] == 'WR'].copy()
 
-# Calculate Error
-wr_comp['diff'] = wr_comp['estimated_routes'] - wr_comp['actual_routes']
-wr_comp['abs_diff'] = wr_comp['diff'].abs()
-wr_comp['pct_error'] = (wr_comp['abs_diff'] / wr_comp['actual_routes']).replace([np.inf, -np.inf], 0)
+# Calculate Error (on arrays; pct_error is 0 where there were no actual routes)
+est = wr_comp['estimated_routes'].to_numpy(dtype=np.float64)
+act = wr_comp['actual_routes'].to_numpy(dtype=np.float64)
+diff = est - act
+abs_diff = np.abs(diff)
+pct_error = np.zeros_like(abs_diff)
+np.divide(abs_diff, act, out=pct_error, where=act != 0)
+wr_comp['diff'] = diff
+wr_comp['abs_diff'] = abs_diff
+wr_comp['pct_error'] = pct_error
 
 print(f"\nComparison for {len(wr_comp)} WR game-weeks:")
 print(f"Correlation: {wr_comp['actual_routes'].corr(wr_comp['estimated_routes']):.4f}")